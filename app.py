@@ -33,6 +33,7 @@ from datetime import datetime, timedelta, timezone
 from config import settings
 from logging_config import setup_logging, get_logger
 from cache import get_cache, generate_weather_cache_key, init_cache
+from http_client import close_async_client
 from storage import get_storage, init_storage, CachedWeather
 from session_middleware import SessionMiddleware, set_session_middleware, optional_auth
 from middleware.rate_limiter import RateLimiterMiddleware
@@ -99,6 +100,7 @@ async def lifespan(app: FastAPI):
     cache = get_cache()
     if cache:
         cache.shutdown()
+    await close_async_client()
     logger.info("Application shutdown complete")
 
 
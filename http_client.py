@@ -0,0 +1,69 @@
+"""
+Shared Async HTTP Client
+
+This module provides a process-wide httpx.AsyncClient so that async
+modules calling upstream APIs (Open-Meteo, etc.) reuse pooled keep-alive
+connections instead of opening a new TCP/TLS connection per request.
+"""
+
+from typing import Any, Optional
+
+import httpx
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from logging_config import get_logger
+
+logger = get_logger(__name__)
+
+# Default upstream timeout in seconds
+DEFAULT_TIMEOUT = 10.0
+
+# Global client instance
+_client: Optional[httpx.AsyncClient] = None
+
+
+def get_async_client() -> httpx.AsyncClient:
+    """
+    Get the global async HTTP client, creating it on first use.
+
+    Returns:
+        The shared httpx.AsyncClient instance
+    """
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(
+            timeout=httpx.Timeout(DEFAULT_TIMEOUT),
+            limits=httpx.Limits(max_keepalive_connections=20)
+        )
+    return _client
+
+
+def decode_json(response: httpx.Response) -> Any:
+    """
+    Decode a JSON response body, using orjson when it is installed.
+
+    Open-Meteo responses are mostly long float arrays, which orjson parses
+    several times faster than the stdlib decoder behind response.json().
+
+    Args:
+        response: Completed httpx response
+
+    Returns:
+        The decoded JSON document
+    """
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
+
+async def close_async_client() -> None:
+    """Close the global async HTTP client and release pooled connections."""
+    global _client
+    if _client is not None and not _client.is_closed:
+        await _client.aclose()
+        logger.info("Async HTTP client closed")
+    _client = None
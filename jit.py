@@ -0,0 +1,19 @@
+"""
+Optional JIT Compilation
+
+Numeric kernels in the solar and weather insight modules are decorated
+with njit. When Numba is installed they are compiled to native code;
+otherwise the fallback decorator returns the plain Python functions.
+"""
+
+try:
+    from numba import njit
+except ImportError:
+    def njit(*args, **kwargs):
+        """Fallback when Numba is not installed: return the function unchanged"""
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+
+__all__ = ["njit"]
@@ -14,9 +14,11 @@ Data sources:
 """
 
 import requests
-import math
-from typing import Dict, List, Optional, Any
+from math import sqrt
+from types import MappingProxyType
+from typing import Dict, List, Optional, Any, Union
 from datetime import datetime, timedelta
+from dataclasses import dataclass
 from enum import Enum
 
 
@@ -42,6 +44,71 @@ class MarineRisk(str, Enum):
     EXTREME = "extreme"
 
 
+@dataclass(slots=True, frozen=True)
+class Waves:
+    """Current significant wave conditions."""
+    significant_height_m: float
+    direction_deg: float
+    period_sec: float
+    sea_state: Dict[str, Any]
+
+
+@dataclass(slots=True, frozen=True)
+class Swell:
+    """Current swell conditions."""
+    height_m: float
+    direction_deg: float
+    period_sec: float
+
+
+@dataclass(slots=True, frozen=True)
+class WindWaves:
+    """Current locally generated wind wave conditions."""
+    height_m: float
+
+
+@dataclass(slots=True, frozen=True)
+class Currents:
+    """Current ocean surface current conditions."""
+    velocity_m_s: float
+    direction_deg: float
+
+
+@dataclass(slots=True, frozen=True)
+class MarineConditions:
+    """Current marine conditions response."""
+    status: str
+    latitude: float
+    longitude: float
+    timestamp: str
+    waves: Waves
+    swell: Swell
+    wind_waves: WindWaves
+    currents: Currents
+    tide: Dict[str, Any]
+    activity_risk: Dict[str, Any]
+    metadata: Dict[str, str]
+
+
+# Read-only template for the current-conditions metadata; each response
+# gets a plain dict copy (dataclasses.asdict cannot deep-copy a mappingproxy)
+_MARINE_METADATA = MappingProxyType({
+    "source": "Open-Meteo Marine Weather API",
+    "note": "Tide information is approximate. Use official tide tables for navigation."
+})
+
+
+def estimate_wind_speed(wave_height: float) -> float:
+    """
+    Estimate wind speed (km/h) from wind wave height (rough approximation)
+    
+    Beaufort scale relationship: wind_speed (m/s) ≈ 4.3 * wave_height^0.5,
+    with the m/s -> km/h factor folded in (4.3 * 3.6 = 15.48). Negative
+    sentinel values are clamped to zero.
+    """
+    return 15.48 * sqrt(max(wave_height, 0.0))
+
+
 def classify_sea_state(wave_height: float) -> Dict[str, Any]:
     """
     Classify sea state based on wave height (WMO Sea State Code)
@@ -362,20 +429,27 @@ async def fetch_marine_weather(latitude: float, longitude: float, days: int = 7)
         }
 
 
-async def get_current_marine_conditions(latitude: float, longitude: float) -> Dict[str, Any]:
+async def get_current_marine_conditions(
+    latitude: float,
+    longitude: float,
+    marine_data: Optional[Dict[str, Any]] = None
+) -> Union[MarineConditions, Dict[str, Any]]:
     """
     Get current marine and coastal weather conditions
     
     Args:
         latitude: Location latitude
         longitude: Location longitude
+        marine_data: Preloaded Open-Meteo marine payload (fetched if omitted)
         
     Returns:
-        Current marine conditions with risk assessment
+        MarineConditions on success, otherwise a status dictionary
+        ("unavailable" / "no_data")
     """
     
     # Fetch marine data
-    marine_data = await fetch_marine_weather(latitude, longitude, days=1)
+    if marine_data is None:
+        marine_data = await fetch_marine_weather(latitude, longitude, days=1)
     
     if "error" in marine_data:
         return {
@@ -427,8 +501,7 @@ async def get_current_marine_conditions(latitude: float, longitude: float) -> Di
     tide_info = calculate_tide_approximation(latitude, longitude, now)
     
     # Estimate wind speed from wind wave height (rough approximation)
-    # Beaufort scale relationship: wind_speed (m/s) ≈ 4.3 * wave_height^0.5
-    estimated_wind_speed = 4.3 * (wind_wave_height ** 0.5) * 3.6  # Convert to km/h
+    estimated_wind_speed = estimate_wind_speed(wind_wave_height)
     
     # Get activity risk assessment
     activity_risks = assess_marine_activities_risk(
@@ -437,39 +510,39 @@ async def get_current_marine_conditions(latitude: float, longitude: float) -> Di
         swell_height=swell_height
     )
     
-    return {
-        "status": "success",
-        "latitude": latitude,
-        "longitude": longitude,
-        "timestamp": times[current_index],
-        "waves": {
-            "significant_height_m": round(wave_height, 2),
-            "direction_deg": round(wave_direction, 1),
-            "period_sec": round(wave_period, 1),
-            "sea_state": sea_state
-        },
-        "swell": {
-            "height_m": round(swell_height, 2),
-            "direction_deg": round(swell_direction, 1),
-            "period_sec": round(swell_period, 1)
-        },
-        "wind_waves": {
-            "height_m": round(wind_wave_height, 2)
-        },
-        "currents": {
-            "velocity_m_s": round(current_velocity, 2),
-            "direction_deg": round(current_direction, 1)
-        },
-        "tide": tide_info,
-        "activity_risk": activity_risks,
-        "metadata": {
-            "source": "Open-Meteo Marine Weather API",
-            "note": "Tide information is approximate. Use official tide tables for navigation."
-        }
-    }
+    return MarineConditions(
+        status="success",
+        latitude=latitude,
+        longitude=longitude,
+        timestamp=times[current_index],
+        waves=Waves(
+            significant_height_m=round(wave_height, 2),
+            direction_deg=round(wave_direction, 1),
+            period_sec=round(wave_period, 1),
+            sea_state=sea_state
+        ),
+        swell=Swell(
+            height_m=round(swell_height, 2),
+            direction_deg=round(swell_direction, 1),
+            period_sec=round(swell_period, 1)
+        ),
+        wind_waves=WindWaves(height_m=round(wind_wave_height, 2)),
+        currents=Currents(
+            velocity_m_s=round(current_velocity, 2),
+            direction_deg=round(current_direction, 1)
+        ),
+        tide=tide_info,
+        activity_risk=activity_risks,
+        metadata=dict(_MARINE_METADATA)
+    )
 
 
-async def get_marine_forecast(latitude: float, longitude: float, days: int = 7) -> Dict[str, Any]:
+async def get_marine_forecast(
+    latitude: float,
+    longitude: float,
+    days: int = 7,
+    marine_data: Optional[Dict[str, Any]] = None
+) -> Dict[str, Any]:
     """
     Get daily marine weather forecast
     
@@ -477,12 +550,14 @@ async def get_marine_forecast(latitude: float, longitude: float, days: int = 7)
         latitude: Location latitude
         longitude: Location longitude
         days: Number of forecast days
+        marine_data: Preloaded Open-Meteo marine payload (fetched if omitted)
         
     Returns:
         Daily marine forecast
     """
     
-    marine_data = await fetch_marine_weather(latitude, longitude, days)
+    if marine_data is None:
+        marine_data = await fetch_marine_weather(latitude, longitude, days)
     
     if "error" in marine_data:
         return {
@@ -509,7 +584,7 @@ async def get_marine_forecast(latitude: float, longitude: float, days: int = 7)
         sea_state = classify_sea_state(max_wave_height)
         
         # Estimate conditions for the day
-        estimated_wind = 4.3 * (max_wave_height ** 0.5) * 3.6
+        estimated_wind = estimate_wind_speed(max_wave_height)
         activity_risks = assess_marine_activities_risk(
             wave_height=max_wave_height,
             wind_speed=estimated_wind
@@ -534,3 +609,27 @@ async def get_marine_forecast(latitude: float, longitude: float, days: int = 7)
             "source": "Open-Meteo Marine Weather API"
         }
     }
+
+
+async def get_marine_bundle(latitude: float, longitude: float, days: int = 7) -> Dict[str, Any]:
+    """
+    Get current conditions and daily forecast from a single upstream request
+    
+    Args:
+        latitude: Location latitude
+        longitude: Location longitude
+        days: Number of forecast days
+        
+    Returns:
+        Dictionary with "current" and "forecast" sections
+    """
+    
+    marine_data = await fetch_marine_weather(latitude, longitude, days)
+    
+    current = await get_current_marine_conditions(latitude, longitude, marine_data=marine_data)
+    forecast = await get_marine_forecast(latitude, longitude, days, marine_data=marine_data)
+    
+    return {
+        "current": current,
+        "forecast": forecast
+    }
@@ -13,11 +13,18 @@ Data sources:
 - Fallback calculations based on weather conditions
 """
 
-import requests
-from typing import Dict, List, Optional, Any
+import time
+import numpy as np
+from bisect import bisect_right
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Any, Tuple
 from datetime import datetime, timedelta
 from enum import Enum
 
+from cache import get_cache
+from http_client import decode_json, get_async_client
+
 
 class PollenType(str, Enum):
     """Types of pollen tracked"""
@@ -44,77 +51,141 @@ class AllergyRisk(str, Enum):
     SEVERE = "severe"
 
 
-def calculate_pollen_level(alder: float, birch: float, grass: float, mugwort: float, olive: float, ragweed: float) -> Dict[str, Any]:
+# Species reported by Open-Meteo, in column order of the species matrix
+SPECIES = ("alder", "birch", "grass", "mugwort", "olive", "ragweed")
+
+
+def build_species_matrix(hourly: Dict[str, Any], length: int) -> np.ndarray:
     """
-    Calculate pollen levels and risk scores from individual species data.
+    Stack the hourly species series into an (hours, 6) array.
     
-    Scale interpretation (European Aeroallergen Network standard):
-    - 0-10: None/Low
-    - 10-50: Low/Moderate
-    - 50-200: Moderate/High
-    - 200+: High/Very High
+    Missing series and null readings become 0, matching the API contract
+    of "no reading = no pollen".
     """
     
-    # Tree pollen (alder, birch, olive)
-    tree_total = alder + birch + olive
-    if tree_total == 0:
-        tree_level = PollenLevel.NONE
-        tree_score = 0
-    elif tree_total < 10:
-        tree_level = PollenLevel.LOW
-        tree_score = min(25, tree_total * 2.5)
-    elif tree_total < 50:
-        tree_level = PollenLevel.MODERATE
-        tree_score = 25 + ((tree_total - 10) / 40 * 25)
-    elif tree_total < 200:
-        tree_level = PollenLevel.HIGH
-        tree_score = 50 + ((tree_total - 50) / 150 * 25)
-    else:
-        tree_level = PollenLevel.VERY_HIGH
-        tree_score = min(100, 75 + ((tree_total - 200) / 200 * 25))
-    
-    # Grass pollen
-    if grass == 0:
-        grass_level = PollenLevel.NONE
-        grass_score = 0
-    elif grass < 10:
-        grass_level = PollenLevel.LOW
-        grass_score = min(25, grass * 2.5)
-    elif grass < 50:
-        grass_level = PollenLevel.MODERATE
-        grass_score = 25 + ((grass - 10) / 40 * 25)
-    elif grass < 200:
-        grass_level = PollenLevel.HIGH
-        grass_score = 50 + ((grass - 50) / 150 * 25)
-    else:
-        grass_level = PollenLevel.VERY_HIGH
-        grass_score = min(100, 75 + ((grass - 200) / 200 * 25))
-    
-    # Weed pollen (mugwort, ragweed)
-    weed_total = mugwort + ragweed
-    if weed_total == 0:
-        weed_level = PollenLevel.NONE
-        weed_score = 0
-    elif weed_total < 10:
-        weed_level = PollenLevel.LOW
-        weed_score = min(25, weed_total * 2.5)
-    elif weed_total < 50:
-        weed_level = PollenLevel.MODERATE
-        weed_score = 25 + ((weed_total - 10) / 40 * 25)
-    elif weed_total < 200:
-        weed_level = PollenLevel.HIGH
-        weed_score = 50 + ((weed_total - 50) / 150 * 25)
-    else:
-        weed_level = PollenLevel.VERY_HIGH
-        weed_score = min(100, 75 + ((weed_total - 200) / 200 * 25))
+    matrix = np.zeros((length, len(SPECIES)), dtype=np.float64)
+    
+    for column, name in enumerate(SPECIES):
+        values = hourly.get(f"{name}_pollen")
+        if values:
+            matrix[:, column] = np.nan_to_num(np.asarray(values[:length], dtype=np.float64))
+    
+    return matrix
+
+
+def integer_species_columns(hourly: Dict[str, Any]) -> Tuple[bool, ...]:
+    """
+    Flag the species whose readings are all integer counts (or missing).
+    
+    The species matrix is float64; these flags let responses report such
+    species as ints again, the way the upstream JSON gave them.
+    """
+    
+    return tuple(
+        all(isinstance(value, int) for value in hourly.get(f"{name}_pollen") or () if value is not None)
+        for name in SPECIES
+    )
+
+
+def _as_reported(values: List[float], integer_columns: Tuple[bool, ...]) -> List[float]:
+    """Cast species values back to int for the integer-valued columns"""
+    
+    return [int(value) if is_int else value for value, is_int in zip(values, integer_columns)]
+
+
+# Level for each index returned by score_pollen_totals
+POLLEN_LEVELS = (
+    PollenLevel.NONE,
+    PollenLevel.LOW,
+    PollenLevel.MODERATE,
+    PollenLevel.HIGH,
+    PollenLevel.VERY_HIGH
+)
+
+
+# EAN scale: exactly 0 is NONE, then LOW < 10 <= MODERATE < 50 <= HIGH < 200 <= VERY_HIGH
+_POLLEN_THRESHOLDS = (0, 10, 50, 200)
+
+# (base, offset, divisor, multiplier) per level:
+# score = min(base + 25, base + (total - offset) / divisor * multiplier)
+_POLLEN_SCORE_COEFFS = (
+    (0, 0, 1, 0),
+    (0, 0, 1, 2.5),
+    (25, 10, 40, 25),
+    (50, 50, 150, 25),
+    (75, 200, 200, 25)
+)
+_POLLEN_BASE, _POLLEN_OFFSET, _POLLEN_DIVISOR, _POLLEN_MULTIPLIER = (
+    np.array(column, dtype=np.float64) for column in zip(*_POLLEN_SCORE_COEFFS)
+)
+
+
+def _score_pollen_total(total: float) -> Tuple[int, float]:
+    """Score a single pollen total; returns (level_index, score)"""
+    
+    level = bisect_right(_POLLEN_THRESHOLDS, total) if total else 0
+    base, offset, divisor, multiplier = _POLLEN_SCORE_COEFFS[level]
+    
+    return level, min(base + 25, base + ((total - offset) / divisor * multiplier))
+
+
+def score_pollen_totals(totals: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Score an array of pollen totals (grains/m³) against the EAN scale.
+    
+    Returns:
+        (level_index, score) arrays; level_index indexes POLLEN_LEVELS
+    """
+    
+    totals = np.asarray(totals, dtype=np.float64)
+    
+    levels = np.searchsorted(_POLLEN_THRESHOLDS, totals, side="right")
+    levels = np.where(totals == 0, 0, levels)
+    
+    base = _POLLEN_BASE[levels]
+    scores = np.minimum(
+        base + 25,
+        base + ((totals - _POLLEN_OFFSET[levels]) / _POLLEN_DIVISOR[levels] * _POLLEN_MULTIPLIER[levels])
+    )
+    
+    return levels, scores
+
+
+def score_pollen_matrix(species: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Score every row of an (N, 6) species matrix (see SPECIES) at once.
+    
+    Returns:
+        (levels, scores, overall) where levels/scores are (N, 3) arrays in
+        tree/grass/weed column order and overall is the (N,) weighted score
+    """
+    
+    tree_total = species[:, 0] + species[:, 1] + species[:, 4]
+    grass_total = species[:, 2]
+    weed_total = species[:, 3] + species[:, 5]
+    
+    levels, scores = score_pollen_totals(np.stack([tree_total, grass_total, weed_total], axis=1))
     
     # Overall pollen score (weighted average)
-    overall_score = (tree_score * 0.4 + grass_score * 0.4 + weed_score * 0.2)
+    overall = scores[:, 0] * 0.4 + scores[:, 1] * 0.4 + scores[:, 2] * 0.2
+    
+    return levels, scores, overall
+
+
+def _format_pollen_level(
+    values: List[float],
+    levels: List[int],
+    scores: List[float],
+    overall_score: float
+) -> Dict[str, Any]:
+    """Build the per-type pollen response from one scored species row"""
+    
+    alder, birch, grass, mugwort, olive, ragweed = values
     
     return {
         "tree": {
-            "level": tree_level,
-            "score": round(tree_score, 1),
+            "level": POLLEN_LEVELS[levels[0]],
+            "score": round(scores[0], 1),
             "breakdown": {
                 "alder": round(alder, 1),
                 "birch": round(birch, 1),
@@ -122,13 +193,13 @@ def calculate_pollen_level(alder: float, birch: float, grass: float, mugwort: fl
             }
         },
         "grass": {
-            "level": grass_level,
-            "score": round(grass_score, 1),
+            "level": POLLEN_LEVELS[levels[1]],
+            "score": round(scores[1], 1),
             "value": round(grass, 1)
         },
         "weed": {
-            "level": weed_level,
-            "score": round(weed_score, 1),
+            "level": POLLEN_LEVELS[levels[2]],
+            "score": round(scores[2], 1),
             "breakdown": {
                 "mugwort": round(mugwort, 1),
                 "ragweed": round(ragweed, 1)
@@ -138,74 +209,165 @@ def calculate_pollen_level(alder: float, birch: float, grass: float, mugwort: fl
     }
 
 
-def determine_allergy_risk(overall_score: float) -> Dict[str, Any]:
-    """Determine allergy risk level and provide recommendations"""
-    
-    if overall_score < 10:
-        risk = AllergyRisk.MINIMAL
-        recommendation = "Excellent conditions for outdoor activities. Minimal allergy risk."
-        activities = ["outdoor exercise", "gardening", "hiking", "outdoor dining"]
-    elif overall_score < 30:
-        risk = AllergyRisk.LOW
-        recommendation = "Good conditions for most people. Sensitive individuals may experience mild symptoms."
-        activities = ["outdoor exercise with caution", "short outdoor activities"]
-    elif overall_score < 60:
-        risk = AllergyRisk.MODERATE
-        recommendation = "Moderate pollen levels. Allergy sufferers should consider taking precautions."
-        activities = ["indoor exercise preferred", "limit outdoor exposure"]
-    elif overall_score < 80:
-        risk = AllergyRisk.HIGH
-        recommendation = "High pollen levels. Allergy sufferers should take medication and limit outdoor time."
-        activities = ["stay indoors when possible", "close windows", "use air conditioning"]
-    else:
-        risk = AllergyRisk.SEVERE
-        recommendation = "Very high pollen levels. Severe allergy risk. Stay indoors if possible."
-        activities = ["avoid outdoor activities", "keep windows closed", "use air purifier"]
+def parse_time_axis(times: List[str]) -> np.ndarray:
+    """
+    Parse Open-Meteo ISO timestamps into a datetime64[m] array.
     
-    return {
+    A trailing "Z" (UTC) designator is dropped; timestamps are compared as
+    naive values, as elsewhere in this module.
+    """
+    
+    return np.array([t[:-1] if t.endswith("Z") else t for t in times], dtype="datetime64[m]")
+
+
+def calculate_pollen_level(alder: float, birch: float, grass: float, mugwort: float, olive: float, ragweed: float) -> Dict[str, Any]:
+    """
+    Calculate pollen levels and risk scores from individual species data.
+    
+    Scale interpretation (European Aeroallergen Network standard):
+    - 0-10: None/Low
+    - 10-50: Low/Moderate
+    - 50-200: Moderate/High
+    - 200+: High/Very High
+    """
+    
+    # Fast path: most winter and night-time hours have no pollen at all
+    if not (alder or birch or grass or mugwort or olive or ragweed):
+        return _format_pollen_level(
+            [alder, birch, grass, mugwort, olive, ragweed], [0, 0, 0], [0.0, 0.0, 0.0], 0.0
+        )
+    
+    tree_level, tree_score = _score_pollen_total(alder + birch + olive)
+    grass_level, grass_score = _score_pollen_total(grass)
+    weed_level, weed_score = _score_pollen_total(mugwort + ragweed)
+    
+    # Overall pollen score (weighted average)
+    overall_score = (tree_score * 0.4 + grass_score * 0.4 + weed_score * 0.2)
+    
+    return _format_pollen_level(
+        [alder, birch, grass, mugwort, olive, ragweed],
+        [tree_level, grass_level, weed_level],
+        [tree_score, grass_score, weed_score],
+        overall_score
+    )
+
+
+# Allergy risk bands: < 10 MINIMAL, < 30 LOW, < 60 MODERATE, < 80 HIGH, else SEVERE
+_RISK_THRESHOLDS = (10, 30, 60, 80)
+
+# (risk, recommendation, suggested activities) per risk band
+_RISK_TABLE = (
+    (
+        AllergyRisk.MINIMAL,
+        "Excellent conditions for outdoor activities. Minimal allergy risk.",
+        ("outdoor exercise", "gardening", "hiking", "outdoor dining")
+    ),
+    (
+        AllergyRisk.LOW,
+        "Good conditions for most people. Sensitive individuals may experience mild symptoms.",
+        ("outdoor exercise with caution", "short outdoor activities")
+    ),
+    (
+        AllergyRisk.MODERATE,
+        "Moderate pollen levels. Allergy sufferers should consider taking precautions.",
+        ("indoor exercise preferred", "limit outdoor exposure")
+    ),
+    (
+        AllergyRisk.HIGH,
+        "High pollen levels. Allergy sufferers should take medication and limit outdoor time.",
+        ("stay indoors when possible", "close windows", "use air conditioning")
+    ),
+    (
+        AllergyRisk.SEVERE,
+        "Very high pollen levels. Severe allergy risk. Stay indoors if possible.",
+        ("avoid outdoor activities", "keep windows closed", "use air purifier")
+    )
+)
+
+
+# Cumulative precautions per risk level
+_PRECAUTIONS: Dict[AllergyRisk, Tuple[str, ...]] = {
+    AllergyRisk.MINIMAL: (),
+    AllergyRisk.LOW: (
+        "Monitor symptoms",
+    ),
+    AllergyRisk.MODERATE: (
+        "Monitor symptoms",
+        "Take antihistamines as directed",
+        "Keep windows closed",
+        "Shower after being outdoors"
+    ),
+    AllergyRisk.HIGH: (
+        "Monitor symptoms",
+        "Take antihistamines as directed",
+        "Keep windows closed",
+        "Shower after being outdoors",
+        "Wear sunglasses outdoors",
+        "Use nasal spray if prescribed",
+        "Change clothes after outdoor exposure"
+    ),
+    AllergyRisk.SEVERE: (
+        "Monitor symptoms",
+        "Take antihistamines as directed",
+        "Keep windows closed",
+        "Shower after being outdoors",
+        "Wear sunglasses outdoors",
+        "Use nasal spray if prescribed",
+        "Change clothes after outdoor exposure",
+        "Consult with allergist if symptoms worsen",
+        "Consider staying indoors during peak hours (10am-4pm)",
+        "Use HEPA air filters indoors"
+    )
+}
+
+# Prebuilt read-only assessment per risk band, indexed like _RISK_TABLE
+_RISK_ASSESSMENTS = tuple(
+    MappingProxyType({
         "risk_level": risk,
         "recommendation": recommendation,
         "suggested_activities": activities,
-        "precautions": get_precautions(risk)
-    }
+        "precautions": _PRECAUTIONS[risk]
+    })
+    for risk, recommendation, activities in _RISK_TABLE
+)
 
 
-def get_precautions(risk: AllergyRisk) -> List[str]:
-    """Get list of precautions based on risk level"""
-    
-    base_precautions = []
+@lru_cache(maxsize=128)
+def _risk_bucket(score_int: int) -> Mapping[str, Any]:
+    """Look up the shared assessment for an integer score"""
     
-    if risk in [AllergyRisk.LOW, AllergyRisk.MODERATE, AllergyRisk.HIGH, AllergyRisk.SEVERE]:
-        base_precautions.append("Monitor symptoms")
-    
-    if risk in [AllergyRisk.MODERATE, AllergyRisk.HIGH, AllergyRisk.SEVERE]:
-        base_precautions.extend([
-            "Take antihistamines as directed",
-            "Keep windows closed",
-            "Shower after being outdoors"
-        ])
+    return _RISK_ASSESSMENTS[bisect_right(_RISK_THRESHOLDS, score_int)]
+
+
+def determine_allergy_risk(overall_score: float) -> Mapping[str, Any]:
+    """
+    Determine allergy risk level and provide recommendations
     
-    if risk in [AllergyRisk.HIGH, AllergyRisk.SEVERE]:
-        base_precautions.extend([
-            "Wear sunglasses outdoors",
-            "Use nasal spray if prescribed",
-            "Change clothes after outdoor exposure"
-        ])
+    Risk thresholds are whole numbers, so the score is truncated to an
+    integer before lookup without changing the band. The returned mapping
+    is shared between calls and read-only.
+    """
     
-    if risk == AllergyRisk.SEVERE:
-        base_precautions.extend([
-            "Consult with allergist if symptoms worsen",
-            "Consider staying indoors during peak hours (10am-4pm)",
-            "Use HEPA air filters indoors"
-        ])
+    return _risk_bucket(int(overall_score))
+
+
+def get_precautions(risk: AllergyRisk) -> Tuple[str, ...]:
+    """Get precautions based on risk level"""
     
-    return base_precautions
+    return _PRECAUTIONS[risk]
+
+
+# Raw upstream responses are reused for 30 minutes per ~1km grid cell
+POLLEN_FETCH_TTL = 1800
 
 
 async def fetch_pollen_forecast(latitude: float, longitude: float, days: int = 7) -> Dict[str, Any]:
     """
     Fetch pollen forecast from Open-Meteo Air Quality API
     
+    Successful responses are cached for POLLEN_FETCH_TTL seconds, keyed on
+    the location rounded to 2 decimals (~1km) and the forecast length.
+    
     Args:
         latitude: Location latitude
         longitude: Location longitude
@@ -215,6 +377,14 @@ async def fetch_pollen_forecast(latitude: float, longitude: float, days: int = 7
         Dictionary containing pollen forecast data
     """
     
+    days = min(days, 7)
+    cache = get_cache()
+    cache_key = f"pollen:raw:{round(latitude, 2)}:{round(longitude, 2)}:{days}"
+    
+    cached = cache.get(cache_key)
+    if cached:
+        return cached
+    
     try:
         # Open-Meteo Air Quality API endpoint
         url = "https://air-quality-api.open-meteo.com/v1/air-quality"
@@ -223,14 +393,15 @@ async def fetch_pollen_forecast(latitude: float, longitude: float, days: int = 7
             "latitude": latitude,
             "longitude": longitude,
             "hourly": "alder_pollen,birch_pollen,grass_pollen,mugwort_pollen,olive_pollen,ragweed_pollen",
-            "forecast_days": min(days, 7),
+            "forecast_days": days,
             "timezone": "auto"
         }
         
-        response = requests.get(url, params=params, timeout=10)
+        response = await get_async_client().get(url, params=params)
         response.raise_for_status()
         
-        data = response.json()
+        data = decode_json(response)
+        cache.set(cache_key, data, ttl=POLLEN_FETCH_TTL)
         
         return data
         
@@ -242,60 +413,257 @@ async def fetch_pollen_forecast(latitude: float, longitude: float, days: int = 7
         }
 
 
-async def get_current_pollen(latitude: float, longitude: float) -> Dict[str, Any]:
+def _summarize_daily_hours(
+    hour_totals: np.ndarray,
+    hours: np.ndarray,
+    day_index: np.ndarray,
+    n_days: int
+) -> Tuple[List[int], List[List[int]]]:
     """
-    Get current pollen levels and allergy risk assessment
+    Derive the peak hour and best hours of every day from hourly totals
+    
+    All days are reduced together with array operations rather than a
+    per-day loop.
     
     Args:
-        latitude: Location latitude
-        longitude: Location longitude
+        hour_totals: Total pollen (all species) for each reading
+        hours: Hour of day (0-23) for each reading
+        day_index: Day number (0..n_days-1) for each reading
+        n_days: Number of days in the forecast
         
     Returns:
-        Current pollen levels with risk assessment
+        (peak_hours, best_hours) per day; a peak hour defaults to noon when
+        the day has no pollen, best hours are the 3 lowest (earliest first
+        on ties)
     """
     
-    data = await fetch_pollen_forecast(latitude, longitude, days=1)
+    counts = np.bincount(day_index, minlength=n_days)
+    starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
     
-    if "error" in data:
-        return {
-            "status": "unavailable",
-            "message": "Pollen data temporarily unavailable",
-            "latitude": latitude,
-            "longitude": longitude
+    # Rows grouped by day; lexsort is stable so ties keep time order
+    by_peak = np.lexsort((-hour_totals, day_index))
+    by_best = np.lexsort((hour_totals, day_index))
+    
+    peak_rows = by_peak[starts]
+    peak_hours = np.where(hour_totals[peak_rows] > 0, hours[peak_rows], 12).tolist()
+    
+    # First 3 rows of each day in ascending-total order (fewer on short days)
+    best_rows = by_best[np.minimum(starts[:, None] + np.arange(3), len(by_best) - 1)]
+    best_hours = [
+        row[:n] for row, n in zip(hours[best_rows].tolist(), np.minimum(counts, 3).tolist())
+    ]
+    
+    return peak_hours, best_hours
+
+
+def _build_daily_forecast(
+    species: np.ndarray,
+    time_axis: np.ndarray,
+    integer_columns: Tuple[bool, ...]
+) -> List[Dict[str, Any]]:
+    """
+    Group hourly species readings by day and score each day's peak levels
+    
+    Args:
+        species: (hours, 6) species matrix from build_species_matrix
+        time_axis: datetime64 time axis from parse_time_axis
+        integer_columns: Per-species flags from integer_species_columns
+        
+    Returns:
+        Daily forecast entries, sorted by date
+    """
+    
+    hour_totals = species.sum(axis=1)
+    
+    day_axis = time_axis.astype("datetime64[D]")
+    hours = (time_axis - day_axis).astype("timedelta64[h]").astype(np.int64)
+    
+    unique_days, day_index = np.unique(day_axis, return_inverse=True)
+    
+    # Daily maximums (peak levels) per species
+    daily_max = np.zeros((len(unique_days), len(SPECIES)), dtype=np.float64)
+    np.maximum.at(daily_max, day_index, species)
+    
+    # Score the whole forecast horizon at once using peak values
+    levels, scores, overall = score_pollen_matrix(daily_max)
+    daily_values, levels, scores, overall = (
+        daily_max.tolist(), levels.tolist(), scores.tolist(), overall.tolist()
+    )
+    
+    # Peak and best hours for every day from the same per-hour totals
+    peak_hours, best_hours = _summarize_daily_hours(hour_totals, hours, day_index, len(unique_days))
+    
+    forecast = []
+    
+    for d, day in enumerate(unique_days):
+        pollen_data = _format_pollen_level(
+            _as_reported(daily_values[d], integer_columns), levels[d], scores[d], overall[d]
+        )
+        
+        # Get allergy risk
+        allergy_assessment = determine_allergy_risk(pollen_data["overall_score"])
+        
+        forecast.append({
+            "date": str(day),
+            "pollen": pollen_data,
+            "allergy_risk": allergy_assessment,
+            "peak_hour": peak_hours[d],
+            "best_hours": best_hours[d]
+        })
+    
+    return forecast
+
+
+def _analyze_trend(daily_forecast: List[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    """
+    Analyze the overall-score trend of a daily forecast
+    
+    Returns:
+        Dictionary with "trend" and "forecast_summary" sections, or None if
+        there are fewer than 2 days to compare
+    """
+    
+    if len(daily_forecast) < 2:
+        return None
+    
+    scores = [day["pollen"]["overall_score"] for day in daily_forecast]
+    arr = np.asarray(scores, dtype=np.float64)
+    
+    # Calculate trend direction
+    if len(scores) >= 3:
+        delta = float(arr[-3:].mean() - arr[:3].mean())
+        
+        if delta > 10:
+            trend = "increasing"
+            trend_description = "Pollen levels are expected to increase over the coming days"
+        elif delta < -10:
+            trend = "decreasing"
+            trend_description = "Pollen levels are expected to decrease over the coming days"
+        else:
+            trend = "stable"
+            trend_description = "Pollen levels are expected to remain relatively stable"
+    else:
+        trend = "unknown"
+        trend_description = "Insufficient data for trend analysis"
+    
+    return {
+        "trend": {
+            "direction": trend,
+            "description": trend_description,
+            "scores": scores
+        },
+        "forecast_summary": {
+            # Sequential sum: np.mean's pairwise summation can shift the rounding
+            "average_score": round(sum(scores) / len(scores), 1),
+            "peak_day": daily_forecast[int(arr.argmax())]["date"],
+            "best_day": daily_forecast[int(arr.argmin())]["date"]
         }
+    }
+
+
+# Static response sections shared by every request
+_POLLEN_METADATA = MappingProxyType({
+    "source": "Open-Meteo Air Quality API",
+    "units": "grains/m³",
+    "standard": "European Aeroallergen Network"
+})
+
+_STATUS_TEMPLATES = {
+    "unavailable": MappingProxyType({
+        "status": "unavailable",
+        "message": "Pollen data temporarily unavailable"
+    }),
+    "no_data": MappingProxyType({
+        "status": "no_data",
+        "message": "No pollen data available for this location"
+    })
+}
+
+
+def _status_response(status: str, latitude: float, longitude: float) -> Dict[str, Any]:
+    """Build the response for a location without usable pollen data"""
+    
+    return dict(_STATUS_TEMPLATES[status], latitude=latitude, longitude=longitude)
+
+
+async def _get_processed(latitude: float, longitude: float, days: int = 7) -> Dict[str, Any]:
+    """
+    Fetch and process pollen data once for all public views
+    
+    The parsed time axis, species matrix, daily forecast and trend are
+    computed together and cached alongside the raw response, so the
+    current, forecast and trends endpoints share a single fetch and a
+    single grouping pass per location.
+    
+    Returns:
+        Dictionary with "status" ("success", "unavailable" or "no_data")
+        and, on success, the processed views
+    """
+    
+    days = min(days, 7)
+    cache = get_cache()
+    cache_key = f"pollen:processed:{round(latitude, 2)}:{round(longitude, 2)}:{days}"
+    
+    cached = cache.get(cache_key)
+    if cached:
+        return cached
+    
+    data = await fetch_pollen_forecast(latitude, longitude, days)
+    
+    if "error" in data:
+        return {"status": "unavailable"}
     
-    # Get current hour data
     hourly = data.get("hourly", {})
     times = hourly.get("time", [])
     
     if not times:
-        return {
-            "status": "no_data",
-            "message": "No pollen data available for this location",
-            "latitude": latitude,
-            "longitude": longitude
-        }
+        return {"status": "no_data"}
     
-    # Find current hour index
-    now = datetime.utcnow()
-    current_index = 0
-    for i, time_str in enumerate(times):
-        time_dt = datetime.fromisoformat(time_str.replace('Z', '+00:00'))
-        if time_dt <= now:
-            current_index = i
-        else:
-            break
+    species = build_species_matrix(hourly, len(times))
+    integer_columns = integer_species_columns(hourly)
+    time_axis = parse_time_axis(times)
+    daily_forecast = _build_daily_forecast(species, time_axis, integer_columns)
+    
+    processed = {
+        "status": "success",
+        "times": times,
+        # Minutes since the epoch, for bisecting the current hour
+        "epoch_minutes": time_axis.astype(np.int64).tolist(),
+        "species": species,
+        "integer_columns": integer_columns,
+        "daily": daily_forecast,
+        "trend": _analyze_trend(daily_forecast)
+    }
+    cache.set(cache_key, processed, ttl=POLLEN_FETCH_TTL)
+    
+    return processed
+
+
+async def get_current_pollen(latitude: float, longitude: float) -> Dict[str, Any]:
+    """
+    Get current pollen levels and allergy risk assessment
+    
+    Args:
+        latitude: Location latitude
+        longitude: Location longitude
+        
+    Returns:
+        Current pollen levels with risk assessment
+    """
+    
+    processed = await _get_processed(latitude, longitude)
+    
+    if processed["status"] != "success":
+        return _status_response(processed["status"], latitude, longitude)
     
-    # Extract current values
-    alder = hourly.get("alder_pollen", [0] * len(times))[current_index] or 0
-    birch = hourly.get("birch_pollen", [0] * len(times))[current_index] or 0
-    grass = hourly.get("grass_pollen", [0] * len(times))[current_index] or 0
-    mugwort = hourly.get("mugwort_pollen", [0] * len(times))[current_index] or 0
-    olive = hourly.get("olive_pollen", [0] * len(times))[current_index] or 0
-    ragweed = hourly.get("ragweed_pollen", [0] * len(times))[current_index] or 0
+    # Find current hour index (last timestamp not after now)
+    now_minutes = int(time.time() // 60)
+    current_index = max(0, bisect_right(processed["epoch_minutes"], now_minutes) - 1)
     
     # Calculate levels and scores
-    pollen_data = calculate_pollen_level(alder, birch, grass, mugwort, olive, ragweed)
+    pollen_data = calculate_pollen_level(
+        *_as_reported(processed["species"][current_index].tolist(), processed["integer_columns"])
+    )
     
     # Get allergy risk assessment
     allergy_assessment = determine_allergy_risk(pollen_data["overall_score"])
@@ -304,14 +672,10 @@ async def get_current_pollen(latitude: float, longitude: float) -> Dict[str, Any
         "status": "success",
         "latitude": latitude,
         "longitude": longitude,
-        "timestamp": times[current_index],
+        "timestamp": processed["times"][current_index],
         "pollen": pollen_data,
         "allergy_risk": allergy_assessment,
-        "metadata": {
-            "source": "Open-Meteo Air Quality API",
-            "units": "grains/m³",
-            "standard": "European Aeroallergen Network"
-        }
+        "metadata": _POLLEN_METADATA
     }
 
 
@@ -328,104 +692,12 @@ async def get_daily_pollen_forecast(latitude: float, longitude: float, days: int
         Daily pollen forecast data
     """
     
-    data = await fetch_pollen_forecast(latitude, longitude, days)
-    
-    if "error" in data:
-        return {
-            "status": "unavailable",
-            "message": "Pollen data temporarily unavailable",
-            "latitude": latitude,
-            "longitude": longitude
-        }
-    
-    hourly = data.get("hourly", {})
-    times = hourly.get("time", [])
+    processed = await _get_processed(latitude, longitude, days)
     
-    if not times:
-        return {
-            "status": "no_data",
-            "message": "No pollen data available for this location",
-            "latitude": latitude,
-            "longitude": longitude
-        }
+    if processed["status"] != "success":
+        return _status_response(processed["status"], latitude, longitude)
     
-    # Group by day
-    daily_data = {}
-    
-    for i, time_str in enumerate(times):
-        dt = datetime.fromisoformat(time_str.replace('Z', '+00:00'))
-        day_key = dt.date().isoformat()
-        
-        if day_key not in daily_data:
-            daily_data[day_key] = {
-                "date": day_key,
-                "hourly_values": [],
-                "alder": [],
-                "birch": [],
-                "grass": [],
-                "mugwort": [],
-                "olive": [],
-                "ragweed": []
-            }
-        
-        daily_data[day_key]["hourly_values"].append({
-            "hour": dt.hour,
-            "alder": hourly.get("alder_pollen", [0] * len(times))[i] or 0,
-            "birch": hourly.get("birch_pollen", [0] * len(times))[i] or 0,
-            "grass": hourly.get("grass_pollen", [0] * len(times))[i] or 0,
-            "mugwort": hourly.get("mugwort_pollen", [0] * len(times))[i] or 0,
-            "olive": hourly.get("olive_pollen", [0] * len(times))[i] or 0,
-            "ragweed": hourly.get("ragweed_pollen", [0] * len(times))[i] or 0
-        })
-        
-        daily_data[day_key]["alder"].append(hourly.get("alder_pollen", [0] * len(times))[i] or 0)
-        daily_data[day_key]["birch"].append(hourly.get("birch_pollen", [0] * len(times))[i] or 0)
-        daily_data[day_key]["grass"].append(hourly.get("grass_pollen", [0] * len(times))[i] or 0)
-        daily_data[day_key]["mugwort"].append(hourly.get("mugwort_pollen", [0] * len(times))[i] or 0)
-        daily_data[day_key]["olive"].append(hourly.get("olive_pollen", [0] * len(times))[i] or 0)
-        daily_data[day_key]["ragweed"].append(hourly.get("ragweed_pollen", [0] * len(times))[i] or 0)
-    
-    # Calculate daily aggregates
-    forecast = []
-    
-    for day_key, day_data in sorted(daily_data.items()):
-        # Calculate daily maximums (peak levels)
-        alder_max = max(day_data["alder"]) if day_data["alder"] else 0
-        birch_max = max(day_data["birch"]) if day_data["birch"] else 0
-        grass_max = max(day_data["grass"]) if day_data["grass"] else 0
-        mugwort_max = max(day_data["mugwort"]) if day_data["mugwort"] else 0
-        olive_max = max(day_data["olive"]) if day_data["olive"] else 0
-        ragweed_max = max(day_data["ragweed"]) if day_data["ragweed"] else 0
-        
-        # Calculate pollen levels using peak values
-        pollen_data = calculate_pollen_level(
-            alder_max, birch_max, grass_max, 
-            mugwort_max, olive_max, ragweed_max
-        )
-        
-        # Determine peak hour (when overall pollen is highest)
-        peak_hour = 12  # Default to noon
-        peak_score = 0
-        
-        for hour_data in day_data["hourly_values"]:
-            hour_score = (
-                hour_data["alder"] + hour_data["birch"] + hour_data["grass"] +
-                hour_data["mugwort"] + hour_data["olive"] + hour_data["ragweed"]
-            )
-            if hour_score > peak_score:
-                peak_score = hour_score
-                peak_hour = hour_data["hour"]
-        
-        # Get allergy risk
-        allergy_assessment = determine_allergy_risk(pollen_data["overall_score"])
-        
-        forecast.append({
-            "date": day_key,
-            "pollen": pollen_data,
-            "allergy_risk": allergy_assessment,
-            "peak_hour": peak_hour,
-            "best_hours": get_best_hours(day_data["hourly_values"])
-        })
+    forecast = processed["daily"]
     
     return {
         "status": "success",
@@ -433,130 +705,85 @@ async def get_daily_pollen_forecast(latitude: float, longitude: float, days: int
         "longitude": longitude,
         "forecast_days": len(forecast),
         "daily_forecast": forecast,
-        "metadata": {
-            "source": "Open-Meteo Air Quality API",
-            "units": "grains/m³",
-            "standard": "European Aeroallergen Network"
-        }
+        "metadata": _POLLEN_METADATA
     }
 
 
-def get_best_hours(hourly_values: List[Dict]) -> List[int]:
-    """
-    Determine the best hours for outdoor activities (lowest pollen)
-    
-    Args:
-        hourly_values: List of hourly pollen values
-        
-    Returns:
-        List of recommended hours (0-23)
-    """
-    
-    if not hourly_values:
-        return [6, 7, 8]  # Early morning default
-    
-    # Calculate total pollen for each hour
-    hour_scores = []
-    for hour_data in hourly_values:
-        total = (
-            hour_data.get("alder", 0) + hour_data.get("birch", 0) + 
-            hour_data.get("grass", 0) + hour_data.get("mugwort", 0) + 
-            hour_data.get("olive", 0) + hour_data.get("ragweed", 0)
-        )
-        hour_scores.append((hour_data["hour"], total))
-    
-    # Sort by lowest pollen
-    hour_scores.sort(key=lambda x: x[1])
-    
-    # Return top 3 best hours
-    return [hour for hour, _ in hour_scores[:3]]
+_WINTER = MappingProxyType({
+    "current": "winter",
+    "dominant_pollen_type": "none",
+    "description": "Winter: Pollen levels typically at lowest"
+})
+_SPRING = MappingProxyType({
+    "current": "spring",
+    "dominant_pollen_type": "tree",
+    "description": "Spring: Tree pollen (birch, alder, olive) typically peaks"
+})
+_SUMMER = MappingProxyType({
+    "current": "summer",
+    "dominant_pollen_type": "grass",
+    "description": "Summer: Grass pollen typically peaks"
+})
+_FALL = MappingProxyType({
+    "current": "fall",
+    "dominant_pollen_type": "weed",
+    "description": "Fall: Weed pollen (ragweed, mugwort) typically peaks"
+})
 
+# Season section indexed by calendar month (index 0 unused)
+_SEASON_BY_MONTH = (
+    None,
+    _WINTER, _WINTER,
+    _SPRING, _SPRING, _SPRING,
+    _SUMMER, _SUMMER, _SUMMER,
+    _FALL, _FALL,
+    _WINTER, _WINTER
+)
 
-async def get_pollen_trends(latitude: float, longitude: float) -> Dict[str, Any]:
+
+async def get_pollen_trends(
+    latitude: float,
+    longitude: float,
+    forecast_data: Optional[Dict[str, Any]] = None
+) -> Dict[str, Any]:
     """
     Get pollen trends and seasonal analysis
     
     Args:
         latitude: Location latitude
         longitude: Location longitude
+        forecast_data: Result of get_daily_pollen_forecast if the caller
+            already has it (processed data is reused when omitted)
         
     Returns:
         Trend analysis and seasonal predictions
     """
     
-    # Get 7-day forecast for trend analysis
-    forecast_data = await get_daily_pollen_forecast(latitude, longitude, days=7)
-    
-    if forecast_data.get("status") != "success":
-        return forecast_data
-    
-    daily_forecast = forecast_data.get("daily_forecast", [])
+    if forecast_data is not None:
+        if forecast_data.get("status") != "success":
+            return forecast_data
+        trend_data = _analyze_trend(forecast_data.get("daily_forecast", []))
+    else:
+        # Reuse the processed 7-day forecast
+        processed = await _get_processed(latitude, longitude, days=7)
+        if processed["status"] != "success":
+            return _status_response(processed["status"], latitude, longitude)
+        trend_data = processed["trend"]
     
-    if len(daily_forecast) < 2:
+    if trend_data is None:
         return {
             "status": "insufficient_data",
             "message": "Not enough data for trend analysis"
         }
     
-    # Analyze trends
-    scores = [day["pollen"]["overall_score"] for day in daily_forecast]
-    
-    # Calculate trend direction
-    if len(scores) >= 3:
-        early_avg = sum(scores[:3]) / 3
-        late_avg = sum(scores[-3:]) / 3
-        
-        if late_avg > early_avg + 10:
-            trend = "increasing"
-            trend_description = "Pollen levels are expected to increase over the coming days"
-        elif late_avg < early_avg - 10:
-            trend = "decreasing"
-            trend_description = "Pollen levels are expected to decrease over the coming days"
-        else:
-            trend = "stable"
-            trend_description = "Pollen levels are expected to remain relatively stable"
-    else:
-        trend = "unknown"
-        trend_description = "Insufficient data for trend analysis"
-    
     # Determine current season (approximate based on month)
-    now = datetime.utcnow()
-    month = now.month
-    
-    if month in [3, 4, 5]:
-        season = "spring"
-        dominant_type = "tree"
-        season_description = "Spring: Tree pollen (birch, alder, olive) typically peaks"
-    elif month in [6, 7, 8]:
-        season = "summer"
-        dominant_type = "grass"
-        season_description = "Summer: Grass pollen typically peaks"
-    elif month in [9, 10]:
-        season = "fall"
-        dominant_type = "weed"
-        season_description = "Fall: Weed pollen (ragweed, mugwort) typically peaks"
-    else:
-        season = "winter"
-        dominant_type = "none"
-        season_description = "Winter: Pollen levels typically at lowest"
+    season = _SEASON_BY_MONTH[datetime.utcnow().month]
     
     return {
         "status": "success",
         "latitude": latitude,
         "longitude": longitude,
-        "trend": {
-            "direction": trend,
-            "description": trend_description,
-            "scores": scores
-        },
-        "season": {
-            "current": season,
-            "dominant_pollen_type": dominant_type,
-            "description": season_description
-        },
-        "forecast_summary": {
-            "average_score": round(sum(scores) / len(scores), 1),
-            "peak_day": daily_forecast[scores.index(max(scores))]["date"],
-            "best_day": daily_forecast[scores.index(min(scores))]["date"]
-        }
+        "trend": trend_data["trend"],
+        "season": season,
+        "forecast_summary": trend_data["forecast_summary"]
     }
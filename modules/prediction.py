@@ -6,14 +6,15 @@ Uses linear regression on historical data from Open-Meteo.
 """
 
 import os
-import json
+import math
+import time
+import atexit
 import pickle
-import random
-from typing import Optional, Dict, Any, List, Tuple
+from typing import Optional, Dict, Any, List, Tuple, Union
 from datetime import datetime, timezone, timedelta
 from dataclasses import dataclass
 
-import requests
+import numpy as np
 
 from config import settings
 from logging_config import get_logger
@@ -21,6 +22,39 @@ from cache import get_cache
 
 logger = get_logger(__name__)
 
+# Simple confidence interval half-width (±3°C)
+PREDICTION_CONFIDENCE = 3.0
+
+# How long per-location recent features are reused (seconds)
+LOCATION_FEATURES_TTL = 3600
+
+
+# Cyclical day-of-year encoding, indexed by day of year (1-366)
+_DAY_SIN = tuple(math.sin(2 * math.pi * d / 365) for d in range(367))
+_DAY_COS = tuple(math.cos(2 * math.pi * d / 365) for d in range(367))
+
+# Columnar layout for historical daily rows
+DAILY_DTYPE = np.dtype([("date", "datetime64[D]"), ("tmax", "f8"), ("tmin", "f8")])
+
+
+def to_daily_records(data: List[Dict[str, Any]]) -> np.ndarray:
+    """
+    Convert historical daily rows to a structured array in a single pass.
+    
+    Missing temperatures default as in SimplePredictionModel._compute_features;
+    null temperatures become NaN.
+    
+    Args:
+        data: List of daily weather data with date, temperature_max, temperature_min
+        
+    Returns:
+        Structured array with DAILY_DTYPE fields date, tmax and tmin
+    """
+    return np.array(
+        [(d["date"][:10], d.get("temperature_max", 20), d.get("temperature_min", 10)) for d in data],
+        dtype=DAILY_DTYPE
+    )
+
 
 @dataclass
 class PredictionResult:
@@ -49,7 +83,17 @@ class SimplePredictionModel:
         self.version: str = "1.0.0"
         self.trained_at: Optional[str] = None
         self.feature_names = ["day_of_year_sin", "day_of_year_cos", "prev_temp", "temp_trend"]
-        self._random_seed = 42
+    
+    @property
+    def weights(self) -> Optional[List[float]]:
+        """Feature weights, or None if the model is not trained."""
+        return self._weights
+    
+    @weights.setter
+    def weights(self, value: Optional[List[float]]) -> None:
+        # Keep the float32 copy used by predict() in step with the weights
+        self._weights = value
+        self._weights_np = None if value is None else np.asarray(value, dtype=np.float32)
     
     def _compute_features(self, data: List[Dict[str, Any]], index: int) -> Optional[List[float]]:
         """
@@ -62,14 +106,11 @@ class SimplePredictionModel:
         Returns:
             List of features or None if not enough data
         """
-        import math
-        
         if index < 3:  # Need at least 3 previous days
             return None
         
         current = data[index]
         prev1 = data[index - 1]
-        prev2 = data[index - 2]
         prev3 = data[index - 3]
         
         # Parse date
@@ -77,19 +118,56 @@ class SimplePredictionModel:
         day_of_year = date.timetuple().tm_yday
         
         # Cyclical encoding for day of year
-        day_sin = math.sin(2 * math.pi * day_of_year / 365)
-        day_cos = math.cos(2 * math.pi * day_of_year / 365)
+        day_sin = _DAY_SIN[day_of_year]
+        day_cos = _DAY_COS[day_of_year]
         
         # Previous day temperature (mean)
         prev_temp = (prev1.get("temperature_max", 20) + prev1.get("temperature_min", 10)) / 2
         
         # Temperature trend (difference over 3 days)
-        prev1_mean = (prev1.get("temperature_max", 20) + prev1.get("temperature_min", 10)) / 2
         prev3_mean = (prev3.get("temperature_max", 20) + prev3.get("temperature_min", 10)) / 2
-        trend = (prev1_mean - prev3_mean) / 2
+        trend = (prev_temp - prev3_mean) / 2
         
         return [day_sin, day_cos, prev_temp, trend]
     
+    def _compute_features_bulk(self, data: Union[List[Dict[str, Any]], np.ndarray]) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Compute features and targets for every training sample at once.
+        
+        Row k matches _compute_features(data, k + 3), with the next day's
+        mean temperature as its target. Samples with missing temperatures
+        are dropped.
+        
+        Args:
+            data: Historical data list, or records from to_daily_records()
+            
+        Returns:
+            Tuple of (features, targets) arrays of shape (n, 4) and (n,)
+        """
+        n = len(data)
+        if n < 5:
+            return np.empty((0, len(self.feature_names))), np.empty(0)
+        
+        records = data if isinstance(data, np.ndarray) else to_daily_records(data)
+        mean = (records["tmax"] + records["tmin"]) / 2
+        
+        # Day of year for each sample day (index 3 .. n-2)
+        dates = records["date"][3:n - 1]
+        day_of_year = (dates - dates.astype("datetime64[Y]")).astype(np.int64) + 1
+        
+        # Cyclical encoding for day of year
+        angle = 2 * np.pi * day_of_year / 365
+        
+        # Previous day temperature and trend over 3 days
+        prev_temp = mean[2:n - 2]
+        trend = (mean[2:n - 2] - mean[0:n - 4]) / 2
+        
+        X = np.column_stack([np.sin(angle), np.cos(angle), prev_temp, trend])
+        y = mean[4:n]
+        
+        valid = np.isfinite(X).all(axis=1) & np.isfinite(y)
+        return X[valid], y[valid]
+    
     def train(self, data: List[Dict[str, Any]]) -> bool:
         """
         Train the model on historical data.
@@ -100,49 +178,24 @@ class SimplePredictionModel:
         Returns:
             True if training successful
         """
-        random.seed(self._random_seed)
-        
         if len(data) < 30:
             logger.warning("Not enough data for training (need at least 30 days)")
             return False
         
         # Prepare training data
-        X = []
-        y = []
-        
-        for i in range(3, len(data) - 1):
-            features = self._compute_features(data, i)
-            if features:
-                X.append(features)
-                # Target: next day mean temperature
-                next_day = data[i + 1]
-                target = (next_day.get("temperature_max", 20) + next_day.get("temperature_min", 10)) / 2
-                y.append(target)
+        X, y = self._compute_features_bulk(data)
         
         if len(X) < 10:
             logger.warning("Not enough valid training samples")
             return False
         
-        # Simple gradient descent for linear regression
-        n_features = len(self.feature_names)
-        self.weights = [0.0] * n_features
-        self.bias = sum(y) / len(y)  # Initialize bias to mean
-        
-        learning_rate = 0.01
-        epochs = 100
-        
-        for _ in range(epochs):
-            for xi, yi in zip(X, y):
-                # Prediction
-                pred = self.bias + sum(w * f for w, f in zip(self.weights, xi))
-                
-                # Error
-                error = pred - yi
-                
-                # Update weights
-                for j in range(n_features):
-                    self.weights[j] -= learning_rate * error * xi[j]
-                self.bias -= learning_rate * error
+        # Closed-form least squares on features augmented with a bias column
+        Xa = np.hstack([X, np.ones((len(X), 1))])
+        theta, *_ = np.linalg.lstsq(Xa, y, rcond=None)
+        
+        # float32 is ample precision for a temperature regressor
+        self.weights = theta[:-1].astype(np.float32).tolist()
+        self.bias = float(np.float32(theta[-1]))
         
         self.trained_at = datetime.now(timezone.utc).isoformat()
         logger.info(f"Model trained with {len(X)} samples")
@@ -162,42 +215,36 @@ class SimplePredictionModel:
         if not self.weights:
             raise ValueError("Model not trained")
         
-        pred = self.bias + sum(w * f for w, f in zip(self.weights, features))
-        
-        # Simple confidence interval (±3°C)
-        confidence = 3.0
+        pred = float(self._weights_np @ np.asarray(features, dtype=np.float32) + self.bias)
         
-        return pred, pred - confidence, pred + confidence
+        return pred, pred - PREDICTION_CONFIDENCE, pred + PREDICTION_CONFIDENCE
     
     def save(self, filepath: str) -> None:
-        """Save model to file."""
-        model_data = {
-            "weights": self.weights,
-            "bias": self.bias,
-            "version": self.version,
-            "trained_at": self.trained_at,
-            "feature_names": self.feature_names
-        }
-        
-        with open(filepath, "w") as f:
-            json.dump(model_data, f)
+        """Save model to a binary NumPy .npz file."""
+        with open(filepath, "wb") as f:
+            np.savez(
+                f,
+                weights=np.asarray(self.weights, dtype=np.float32),
+                bias=np.float32(self.bias),
+                version=np.str_(self.version),
+                trained_at=np.str_(self.trained_at or ""),
+                feature_names=np.asarray(self.feature_names, dtype=np.str_)
+            )
         
         logger.info(f"Model saved to {filepath}")
     
     def load(self, filepath: str) -> bool:
-        """Load model from file."""
+        """Load model from a .npz file written by save()."""
         if not os.path.exists(filepath):
             return False
         
         try:
-            with open(filepath, "r") as f:
-                model_data = json.load(f)
-            
-            self.weights = model_data["weights"]
-            self.bias = model_data["bias"]
-            self.version = model_data["version"]
-            self.trained_at = model_data["trained_at"]
-            self.feature_names = model_data["feature_names"]
+            with np.load(filepath) as model_data:
+                self.weights = model_data["weights"].tolist()
+                self.bias = float(model_data["bias"])
+                self.version = str(model_data["version"])
+                self.trained_at = str(model_data["trained_at"]) or None
+                self.feature_names = model_data["feature_names"].tolist()
             
             logger.info(f"Model loaded from {filepath}")
             return True
@@ -220,8 +267,10 @@ class PredictionService:
         """Initialize the prediction service."""
         self._model = SimplePredictionModel()
         self._model_dir = os.path.join(settings.DATA_DIR, "models")
-        self._model_path = os.path.join(self._model_dir, "temp_model.json")
+        self._model_path = os.path.join(self._model_dir, "temp_model.npz")
+        self._loc_cache_path = os.path.join(self._model_dir, "loc_cache.pkl")
         self._historical_url = settings.OPEN_METEO_HISTORICAL_URL
+        self._session = None  # Created on first fetch, see _get_session()
         
         # Create model directory
         os.makedirs(self._model_dir, exist_ok=True)
@@ -229,8 +278,72 @@ class PredictionService:
         # Try to load existing model
         self._model.load(self._model_path)
         
+        # Recent features per (lat, lon) rounded to 0.1°: (features, fetched_at)
+        self._loc_cache: Dict[Tuple[float, float], Tuple[List[float], float]] = self._load_loc_cache()
+        atexit.register(self._save_loc_cache)
+        
+        # Most recent training download: (loc_key, fetched_at, data)
+        self._last_fetch: Optional[Tuple[Tuple[float, float], float, List[Dict[str, Any]]]] = None
+        
         logger.info("Prediction service initialized")
     
+    def _load_loc_cache(self) -> Dict[Tuple[float, float], Tuple[List[float], float]]:
+        """Load persisted per-location features, dropping expired entries."""
+        if not os.path.exists(self._loc_cache_path):
+            return {}
+        
+        try:
+            with open(self._loc_cache_path, "rb") as f:
+                loc_cache = pickle.load(f)
+        except Exception as e:
+            logger.error(f"Failed to load location feature cache: {e}")
+            return {}
+        
+        now = time.time()
+        return {
+            key: entry for key, entry in loc_cache.items()
+            if now - entry[1] < LOCATION_FEATURES_TTL
+        }
+    
+    def _save_loc_cache(self) -> None:
+        """Persist per-location features so a restart keeps the warm path."""
+        try:
+            with open(self._loc_cache_path, "wb") as f:
+                pickle.dump(self._loc_cache, f)
+        except Exception as e:
+            logger.error(f"Failed to save location feature cache: {e}")
+    
+    def _get_session(self):
+        """
+        Get the HTTP session, creating it on first use.
+        
+        requests is imported here so that importing this module (and
+        constructing the service) stays cheap until data is fetched.
+        """
+        if self._session is None:
+            import requests
+            from requests.adapters import HTTPAdapter
+            from urllib3.util.retry import Retry
+            
+            session = requests.Session()
+            
+            # Pooled connections with retries on transient upstream errors
+            adapter = HTTPAdapter(
+                pool_connections=4,
+                pool_maxsize=8,
+                max_retries=Retry(
+                    total=3,
+                    backoff_factor=0.3,
+                    status_forcelist=[502, 503, 504],
+                    raise_on_status=False
+                )
+            )
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            self._session = session
+        
+        return self._session
+    
     def _fetch_historical_data(
         self,
         lat: float,
@@ -241,6 +354,14 @@ class PredictionService:
         end_date = datetime.now(timezone.utc).date() - timedelta(days=1)
         start_date = end_date - timedelta(days=days)
         
+        # The window only moves once a day, so reuse it per ~1km grid cell
+        cache = get_cache()
+        cache_key = f"hist:{round(lat, 2)}:{round(lon, 2)}:{days}:{start_date.isoformat()}"
+        
+        cached = cache.get(cache_key)
+        if cached:
+            return cached
+        
         try:
             params = {
                 "latitude": lat,
@@ -251,7 +372,7 @@ class PredictionService:
                 "timezone": "auto"
             }
             
-            response = requests.get(
+            response = self._get_session().get(
                 self._historical_url,
                 params=params,
                 timeout=30
@@ -275,6 +396,9 @@ class PredictionService:
                     "temperature_min": daily["temperature_2m_min"][i]
                 })
             
+            # Cache for 1 day
+            cache.set(cache_key, result, ttl=86400)
+            
             return result
             
         except Exception as e:
@@ -301,6 +425,8 @@ class PredictionService:
             logger.error("No historical data available for training")
             return False
         
+        self._last_fetch = ((round(lat, 1), round(lon, 1)), time.time(), data)
+        
         # Train model
         success = self._model.train(data)
         
@@ -341,17 +467,26 @@ class PredictionService:
                 # Use fallback prediction
                 return self._fallback_prediction(lat, lon)
         
-        # Fetch recent data for features
-        recent_data = self._fetch_historical_data(lat, lon, 7)
-        
-        if not recent_data or len(recent_data) < 4:
-            return self._fallback_prediction(lat, lon)
-        
-        # Compute features using most recent data
-        features = self._model._compute_features(recent_data, len(recent_data) - 1)
+        # Reuse recent features for this location if still fresh
+        loc_key = (round(lat, 1), round(lon, 1))
+        entry = self._loc_cache.get(loc_key)
         
-        if not features:
-            return self._fallback_prediction(lat, lon)
+        if entry and time.time() - entry[1] < LOCATION_FEATURES_TTL:
+            features = entry[0]
+        else:
+            # Fetch recent data for features, reusing a fresh training download
+            recent_data = self._recent_from_last_fetch(loc_key) or self._fetch_historical_data(lat, lon, 7)
+            
+            if not recent_data or len(recent_data) < 4:
+                return self._fallback_prediction(lat, lon)
+            
+            # Compute features using most recent data
+            features = self._model._compute_features(recent_data, len(recent_data) - 1)
+            
+            if not features:
+                return self._fallback_prediction(lat, lon)
+            
+            self._loc_cache[loc_key] = (features, time.time())
         
         # Make prediction
         try:
@@ -376,6 +511,23 @@ class PredictionService:
             logger.error(f"Prediction failed: {e}")
             return self._fallback_prediction(lat, lon)
     
+    def _recent_from_last_fetch(self, loc_key: Tuple[float, float]) -> Optional[List[Dict[str, Any]]]:
+        """
+        Get the last 7 days from the most recent training download.
+        
+        Training fetches a window ending on the same day as the 7-day
+        feature window, so its tail can stand in for a second request.
+        """
+        if not self._last_fetch:
+            return None
+        
+        fetched_key, fetched_at, data = self._last_fetch
+        if fetched_key != loc_key or time.time() - fetched_at >= LOCATION_FEATURES_TTL:
+            return None
+        
+        # A 7-day window spans 8 daily rows (start and end inclusive)
+        return data[-8:]
+    
     def _fallback_prediction(self, lat: float, lon: float) -> PredictionResult:
         """
         Fallback prediction when model is unavailable.
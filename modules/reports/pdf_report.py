@@ -12,21 +12,81 @@ LIMITATIONS OF CURRENT IMPLEMENTATION:
 
 FOR PRODUCTION USE:
 - Install reportlab: pip install reportlab
-- Replace _create_simple_pdf() with proper reportlab implementation
+- Replace _write_pdf() with proper reportlab implementation
 - Add matplotlib for graphical charts: pip install matplotlib
 - Consider using weasyprint for HTML-to-PDF conversion
 """
 
 import io
-import base64
-from typing import Dict, Any, List, Optional
+from typing import BinaryIO, Dict, Any, List, Optional
 from datetime import datetime, timezone
 
-from config import settings
+import numpy as np
+
 from logging_config import get_logger
 
 logger = get_logger(__name__)
 
+# WMO weather code -> short condition text
+_CONDITION_MAP = {
+    0: "Clear",
+    1: "Mostly Clear",
+    2: "Partly Cloudy",
+    3: "Overcast",
+    45: "Foggy",
+    48: "Fog",
+    51: "Light Drizzle",
+    53: "Drizzle",
+    55: "Heavy Drizzle",
+    61: "Light Rain",
+    63: "Rain",
+    65: "Heavy Rain",
+    71: "Light Snow",
+    73: "Snow",
+    75: "Heavy Snow",
+    80: "Rain Showers",
+    81: "Heavy Showers",
+    82: "Violent Showers",
+    95: "Thunderstorm",
+    96: "T-Storm + Hail",
+    99: "Severe T-Storm"
+}
+
+# Characters that must be backslash-escaped inside PDF string literals
+_PDF_ESCAPE = str.maketrans({"\\": "\\\\", "(": "\\(", ")": "\\)"})
+
+# Static PDF pieces shared by every report. Objects: 1 catalog, 2 pages,
+# 3 page, 4 content stream, 5 font, 6 content stream length.
+_PDF_STATIC_OBJECTS = (
+    (1, b"<<\n/Type /Catalog\n/Pages 2 0 R\n>>"),
+    (2, b"<<\n/Type /Pages\n/Kids [3 0 R]\n/Count 1\n>>"),
+    (3, b"<<\n/Type /Page\n/Parent 2 0 R\n/MediaBox [0 0 612 792]\n"
+        b"/Contents 4 0 R\n/Resources <<\n/Font <<\n/F1 5 0 R\n>>\n>>\n>>"),
+)
+
+
+def _build_pdf_prologue():
+    """Serialize the PDF header and static objects, recording their offsets."""
+    prologue = b"%PDF-1.4\n"
+    offsets = {}
+    for number, body in _PDF_STATIC_OBJECTS:
+        offsets[number] = len(prologue)
+        prologue += b"%d 0 obj\n%s\nendobj\n" % (number, body)
+    return prologue, offsets
+
+
+_PDF_PROLOGUE, _PDF_PROLOGUE_OFFSETS = _build_pdf_prologue()
+_PDF_STREAM_OPEN = b"4 0 obj\n<<\n/Length 6 0 R\n>>\nstream\n"
+_PDF_STREAM_CLOSE = b"\nendstream\nendobj\n"
+_PDF_FONT_OBJECT = b"5 0 obj\n<<\n/Type /Font\n/Subtype /Type1\n/BaseFont /Courier\n>>\nendobj\n"
+_PDF_SIZE = 7
+_PDF_XREF_HEADER = b"xref\n0 %d\n0000000000 65535 f \n" % _PDF_SIZE
+_PDF_TRAILER = b"trailer\n<<\n/Size %d\n/Root 1 0 R\n>>\nstartxref\n" % _PDF_SIZE
+_PDF_EOF = b"%%EOF"
+
+# Dense lookup indexed by code (WMO codes are 0-99)
+_CONDITION_LOOKUP = tuple(_CONDITION_MAP.get(i, "Unknown") for i in range(100))
+
 
 class PDFReportGenerator:
     """
@@ -72,12 +132,37 @@ class PDFReportGenerator:
         # Generate a simple text-based PDF structure
         # In production, use reportlab for proper PDF generation
         
+        buf = io.BytesIO()
+        self.generate_stream(location, weather_data, report_type, buf)
+        
+        return buf.getvalue()
+    
+    def generate_stream(
+        self,
+        location: str,
+        weather_data: Dict[str, Any],
+        report_type: str,
+        out: BinaryIO
+    ) -> None:
+        """
+        Generate a PDF report directly into a writable binary stream.
+        
+        Only the page content stream is buffered, so the caller can send
+        the report as it is written (e.g. from a StreamingResponse).
+        
+        Args:
+            location: Location name
+            weather_data: Weather data dict
+            report_type: "hourly" or "daily"
+            out: Writable binary stream (needs only write())
+        """
+        # Generate a simple text-based PDF structure
+        # In production, use reportlab for proper PDF generation
+        
         content = self._build_content(location, weather_data, report_type)
         
         # Create a minimal PDF structure
-        pdf_bytes = self._create_simple_pdf(content)
-        
-        return pdf_bytes
+        self._write_pdf(content, out)
     
     def _build_content(
         self,
@@ -161,30 +246,9 @@ class PDFReportGenerator:
     
     def _get_condition_text(self, code: int) -> str:
         """Get text description for weather code."""
-        conditions = {
-            0: "Clear",
-            1: "Mostly Clear",
-            2: "Partly Cloudy",
-            3: "Overcast",
-            45: "Foggy",
-            48: "Fog",
-            51: "Light Drizzle",
-            53: "Drizzle",
-            55: "Heavy Drizzle",
-            61: "Light Rain",
-            63: "Rain",
-            65: "Heavy Rain",
-            71: "Light Snow",
-            73: "Snow",
-            75: "Heavy Snow",
-            80: "Rain Showers",
-            81: "Heavy Showers",
-            82: "Violent Showers",
-            95: "Thunderstorm",
-            96: "T-Storm + Hail",
-            99: "Severe T-Storm"
-        }
-        return conditions.get(code, "Unknown")
+        if isinstance(code, int) and 0 <= code < len(_CONDITION_LOOKUP):
+            return _CONDITION_LOOKUP[code]
+        return _CONDITION_MAP.get(code, "Unknown")
     
     def _create_text_chart(self, daily: List[Dict[str, Any]]) -> List[str]:
         """Create a simple text-based temperature chart."""
@@ -203,20 +267,18 @@ class PDFReportGenerator:
         chart_range = max(chart_max - chart_min, 1)
         chart_height = 10
         
+        # Row thresholds (top to bottom) against every day at once
+        max_arr = np.asarray(max_temps, dtype=np.float64)
+        min_arr = np.asarray(min_temps, dtype=np.float64)
+        thresholds = chart_min + (np.arange(chart_height, -1, -1) / chart_height) * chart_range
+        
+        reaches = max_arr[None, :] >= thresholds[:, None]
+        above_min = min_arr[None, :] >= thresholds[:, None]
+        cells = np.where(reaches & ~above_min, " ▓▓ ", np.where(reaches, " ██ ", "    "))
+        
         # Create chart rows
-        for row in range(chart_height, -1, -1):
-            threshold = chart_min + (row / chart_height) * chart_range
-            line = f"{threshold:5.0f}° |"
-            
-            for i, (max_t, min_t) in enumerate(zip(max_temps, min_temps)):
-                if max_t >= threshold > min_t:
-                    line += " ▓▓ "
-                elif max_t >= threshold and min_t >= threshold:
-                    line += " ██ "
-                else:
-                    line += "    "
-            
-            lines.append(line)
+        for threshold, row_cells in zip(thresholds.tolist(), cells.tolist()):
+            lines.append(f"{threshold:5.0f}° |" + "".join(row_cells))
         
         # X-axis
         lines.append("       +" + "----" * len(daily))
@@ -233,99 +295,44 @@ class PDFReportGenerator:
         
         return lines
     
-    def _create_simple_pdf(self, content: str) -> bytes:
-        """
-        Create a minimal PDF structure.
-        
-        This creates a valid PDF with the content as text.
-        For production, use a proper library like reportlab.
-        """
-        # Escape special characters
-        content_escaped = content.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
-        
-        # PDF structure
-        pdf_lines = [
-            "%PDF-1.4",
-            "1 0 obj",
-            "<<",
-            "/Type /Catalog",
-            "/Pages 2 0 R",
-            ">>",
-            "endobj",
-            "2 0 obj",
-            "<<",
-            "/Type /Pages",
-            "/Kids [3 0 R]",
-            "/Count 1",
-            ">>",
-            "endobj",
-            "3 0 obj",
-            "<<",
-            "/Type /Page",
-            "/Parent 2 0 R",
-            "/MediaBox [0 0 612 792]",
-            "/Contents 4 0 R",
-            "/Resources <<",
-            "/Font <<",
-            "/F1 5 0 R",
-            ">>",
-            ">>",
-            ">>",
-            "endobj",
-            "4 0 obj",
-            "<<",
-            "/Length 6 0 R",
-            ">>",
-            "stream",
-        ]
-        
+    def _write_pdf(self, content: str, out: BinaryIO) -> None:
+        """Write a minimal single-page PDF for content to out."""
         # Build content stream
-        stream_content = "BT\n"
-        stream_content += "/F1 9 Tf\n"
+        stream = io.BytesIO()
+        stream.write(b"BT\n/F1 9 Tf\n")
         y = 750
         
         for line in content.split("\n"):
             if y < 50:
                 break
-            # Escape line for PDF
-            safe_line = line.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
-            stream_content += f"1 0 0 1 50 {y} Tm\n"
-            stream_content += f"({safe_line}) Tj\n"
+            # Escape line for PDF (characters outside Latin-1 become "?")
+            safe_line = line.translate(_PDF_ESCAPE).encode("latin-1", "replace")
+            stream.write(b"1 0 0 1 50 %d Tm\n(%s) Tj\n" % (y, safe_line))
             y -= 12
         
-        stream_content += "ET\n"
+        stream.write(b"ET\n")
+        stream_bytes = stream.getvalue()
+        
+        # Constant header and objects 1-3, with their precomputed offsets
+        out.write(_PDF_PROLOGUE)
+        position = len(_PDF_PROLOGUE)
+        offsets = dict(_PDF_PROLOGUE_OFFSETS)
         
-        pdf_lines.append(stream_content)
-        pdf_lines.extend([
-            "endstream",
-            "endobj",
-            f"6 0 obj",
-            f"{len(stream_content)}",
-            "endobj",
-            "5 0 obj",
-            "<<",
-            "/Type /Font",
-            "/Subtype /Type1",
-            "/BaseFont /Courier",
-            ">>",
-            "endobj",
-            "xref",
-            "0 7",
-            "0000000000 65535 f ",
-            "0000000009 00000 n ",
-            "0000000058 00000 n ",
-            "0000000115 00000 n ",
-            "0000000266 00000 n ",
-            "0000000400 00000 n ",
-            "0000000480 00000 n ",
-            "trailer",
-            "<<",
-            "/Size 7",
-            "/Root 1 0 R",
-            ">>",
-            "startxref",
-            "500",
-            "%%EOF"
-        ])
+        # Page content stream (object 4) and its length (object 6)
+        length_object = b"6 0 obj\n%d\nendobj\n" % len(stream_bytes)
+        for number, chunk in (
+            (4, (_PDF_STREAM_OPEN, stream_bytes, _PDF_STREAM_CLOSE)),
+            (6, (length_object,)),
+            (5, (_PDF_FONT_OBJECT,))
+        ):
+            offsets[number] = position
+            for part in chunk:
+                out.write(part)
+                position += len(part)
         
-        return "\n".join(pdf_lines).encode("latin-1")
+        # Cross-reference table, indexed by object number
+        out.write(_PDF_XREF_HEADER)
+        out.write(b"".join(b"%010d 00000 n \n" % offsets[number] for number in range(1, _PDF_SIZE)))
+        out.write(_PDF_TRAILER)
+        out.write(b"%d\n" % position)
+        out.write(_PDF_EOF)
@@ -6,6 +6,7 @@ Uses openpyxl for Excel generation.
 """
 
 import io
+from functools import lru_cache
 from typing import Dict, Any, List, Optional
 from datetime import datetime, timezone
 
@@ -14,6 +15,62 @@ from logging_config import get_logger
 
 logger = get_logger(__name__)
 
+# WMO weather code -> condition text
+_WEATHER_CONDITIONS = {
+    0: "Clear",
+    1: "Mostly Clear",
+    2: "Partly Cloudy",
+    3: "Overcast",
+    45: "Foggy",
+    48: "Fog",
+    51: "Light Drizzle",
+    53: "Drizzle",
+    55: "Heavy Drizzle",
+    61: "Light Rain",
+    63: "Rain",
+    65: "Heavy Rain",
+    71: "Light Snow",
+    73: "Snow",
+    75: "Heavy Snow",
+    80: "Rain Showers",
+    81: "Heavy Showers",
+    82: "Violent Showers",
+    95: "Thunderstorm",
+    96: "T-Storm + Hail",
+    99: "Severe T-Storm"
+}
+
+# Dense lookup indexed by code (WMO codes are 0-99)
+_COND_TABLE = tuple(_WEATHER_CONDITIONS.get(i, "Unknown") for i in range(100))
+
+# Named cell style registered on each workbook for bordered data cells
+DATA_CELL_STYLE = "IntelliWeather Data"
+
+
+@lru_cache(maxsize=1)
+def _report_styles() -> Dict[str, Any]:
+    """
+    Build the report's openpyxl style objects once per process.
+    
+    openpyxl is optional, so the styles are created on first use rather
+    than at import time, then shared by every report.
+    """
+    from openpyxl.styles import Font, Alignment, Border, Side, PatternFill
+    
+    thin = Side(style='thin')
+    
+    return {
+        "title_font": Font(bold=True, size=16, color="4A1C6E"),
+        "header_fill": PatternFill(start_color="4A1C6E", end_color="4A1C6E", fill_type="solid"),
+        "header_font_white": Font(bold=True, color="FFFFFF"),
+        "thin_border": Border(left=thin, right=thin, top=thin, bottom=thin),
+        "header_alignment": Alignment(horizontal='center'),
+        "location_font": Font(size=12),
+        "generated_font": Font(size=10, italic=True),
+        "report_type_font": Font(size=10),
+        "footer_font": Font(italic=True)
+    }
+
 
 class ExcelReportGenerator:
     """
@@ -66,120 +123,111 @@ class ExcelReportGenerator:
         weather_data: Dict[str, Any],
         report_type: str
     ) -> bytes:
-        """Generate Excel using openpyxl."""
+        """
+        Generate Excel using openpyxl.
+        
+        The workbook is written in write-only mode, so rows are streamed to
+        the sheet XML as they are appended instead of being kept as a grid
+        of Cell objects.
+        """
         from openpyxl import Workbook
-        from openpyxl.styles import Font, Alignment, Border, Side, PatternFill
+        from openpyxl.cell import WriteOnlyCell
+        from openpyxl.styles import NamedStyle
+        from openpyxl.styles.fonts import DEFAULT_FONT
         from openpyxl.utils import get_column_letter
         
-        wb = Workbook()
-        ws = wb.active
-        ws.title = "Weather Report"
-        
-        # Styles
-        header_font = Font(bold=True, size=14)
-        title_font = Font(bold=True, size=16, color="4A1C6E")
-        cell_font = Font(size=11)
-        
-        header_fill = PatternFill(start_color="4A1C6E", end_color="4A1C6E", fill_type="solid")
-        header_font_white = Font(bold=True, color="FFFFFF")
+        # One clock read shared by the title block and the metadata sheet
+        now = datetime.now(timezone.utc)
         
-        thin_border = Border(
-            left=Side(style='thin'),
-            right=Side(style='thin'),
-            top=Side(style='thin'),
-            bottom=Side(style='thin')
-        )
+        wb = Workbook(write_only=True)
+        ws = wb.create_sheet("Weather Report")
         
-        # Title Section
-        ws['A1'] = self._branding['title']
-        ws['A1'].font = title_font
-        ws.merge_cells('A1:F1')
-        
-        ws['A2'] = f"Location: {location}"
-        ws['A2'].font = Font(size=12)
+        styles = _report_styles()
+        title_font = styles["title_font"]
+        header_fill = styles["header_fill"]
+        header_font_white = styles["header_font_white"]
+        thin_border = styles["thin_border"]
+        header_alignment = styles["header_alignment"]
         
-        ws['A3'] = f"Generated: {datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S UTC')}"
-        ws['A3'].font = Font(size=10, italic=True)
+        def styled(value: Any, sheet: Any = ws, **style: Any) -> WriteOnlyCell:
+            cell = WriteOnlyCell(sheet, value=value)
+            for name, style_value in style.items():
+                setattr(cell, name, style_value)
+            return cell
         
-        ws['A4'] = f"Report Type: {report_type.title()} Forecast"
-        ws['A4'].font = Font(size=10)
+        # Data cells share one registered style; assigning it by name is a
+        # single lookup instead of re-indexing the Border on every cell
+        wb.add_named_style(NamedStyle(name=DATA_CELL_STYLE, font=DEFAULT_FONT, border=thin_border))
         
-        # Data section starts at row 6
-        start_row = 6
+        def data_cell(value: Any) -> WriteOnlyCell:
+            cell = WriteOnlyCell(ws, value=value)
+            cell.style = DATA_CELL_STYLE
+            return cell
         
         if report_type == "hourly":
             headers = ["Time", "Temperature (°C)", "Humidity (%)", "Wind (m/s)", "Precip. Prob. (%)", "Weather"]
             data = weather_data.get("hourly", [])
-            
-            # Write headers
-            for col, header in enumerate(headers, 1):
-                cell = ws.cell(row=start_row, column=col, value=header)
-                cell.fill = header_fill
-                cell.font = header_font_white
-                cell.border = thin_border
-                cell.alignment = Alignment(horizontal='center')
-            
-            # Write data
-            for row_idx, hour in enumerate(data[:48], start_row + 1):
-                ws.cell(row=row_idx, column=1, value=hour.get("time", "")[:16]).border = thin_border
-                ws.cell(row=row_idx, column=2, value=hour.get("temperature")).border = thin_border
-                ws.cell(row=row_idx, column=3, value=hour.get("humidity")).border = thin_border
-                ws.cell(row=row_idx, column=4, value=hour.get("wind_speed")).border = thin_border
-                ws.cell(row=row_idx, column=5, value=hour.get("precipitation_probability")).border = thin_border
-                ws.cell(row=row_idx, column=6, value=self._get_condition(hour.get("weather_code", 0))).border = thin_border
-        
+            rows = (
+                [
+                    hour.get("time", "")[:16],
+                    hour.get("temperature"),
+                    hour.get("humidity"),
+                    hour.get("wind_speed"),
+                    hour.get("precipitation_probability"),
+                    self._get_condition(hour.get("weather_code", 0))
+                ]
+                for hour in data[:48]
+            )
         else:  # daily
             headers = ["Date", "Max Temp (°C)", "Min Temp (°C)", "Precipitation (mm)", "Precip. Prob. (%)", "Sunrise", "Sunset", "Weather"]
             data = weather_data.get("daily", [])
-            
-            # Write headers
-            for col, header in enumerate(headers, 1):
-                cell = ws.cell(row=start_row, column=col, value=header)
-                cell.fill = header_fill
-                cell.font = header_font_white
-                cell.border = thin_border
-                cell.alignment = Alignment(horizontal='center')
-            
-            # Write data
-            for row_idx, day in enumerate(data, start_row + 1):
-                ws.cell(row=row_idx, column=1, value=day.get("date")).border = thin_border
-                ws.cell(row=row_idx, column=2, value=day.get("temperature_max")).border = thin_border
-                ws.cell(row=row_idx, column=3, value=day.get("temperature_min")).border = thin_border
-                ws.cell(row=row_idx, column=4, value=day.get("precipitation_sum")).border = thin_border
-                ws.cell(row=row_idx, column=5, value=day.get("precipitation_probability_max")).border = thin_border
-                ws.cell(row=row_idx, column=6, value=day.get("sunrise", "")[-5:] if day.get("sunrise") else "").border = thin_border
-                ws.cell(row=row_idx, column=7, value=day.get("sunset", "")[-5:] if day.get("sunset") else "").border = thin_border
-                ws.cell(row=row_idx, column=8, value=self._get_condition(day.get("weather_code", 0))).border = thin_border
+            rows = (
+                [
+                    day.get("date"),
+                    day.get("temperature_max"),
+                    day.get("temperature_min"),
+                    day.get("precipitation_sum"),
+                    day.get("precipitation_probability_max"),
+                    day.get("sunrise", "")[-5:] if day.get("sunrise") else "",
+                    day.get("sunset", "")[-5:] if day.get("sunset") else "",
+                    self._get_condition(day.get("weather_code", 0))
+                ]
+                for day in data
+            )
         
-        # Adjust column widths
+        # Column widths must be set before any row is written
         for col in range(1, len(headers) + 1):
             ws.column_dimensions[get_column_letter(col)].width = 15
         
-        # Add metadata sheet
-        ws_meta = wb.create_sheet("Metadata")
-        ws_meta['A1'] = "IntelliWeather Report Metadata"
-        ws_meta['A1'].font = title_font
-        
-        ws_meta['A3'] = "Data Source:"
-        ws_meta['B3'] = "Open-Meteo API"
-        
-        ws_meta['A4'] = "Report Generated:"
-        ws_meta['B4'] = datetime.now(timezone.utc).isoformat()
-        
-        ws_meta['A5'] = "Location:"
-        ws_meta['B5'] = location
-        
-        ws_meta['A6'] = "Latitude:"
-        ws_meta['B6'] = weather_data.get("latitude", "N/A")
+        # Title Section
+        ws.append([styled(self._branding['title'], font=title_font)])
+        ws.merged_cells.add('A1:F1')
+        ws.append([styled(f"Location: {location}", font=styles["location_font"])])
+        ws.append([styled(f"Generated: {now:%Y-%m-%d %H:%M:%S} UTC", font=styles["generated_font"])])
+        ws.append([styled(f"Report Type: {report_type.title()} Forecast", font=styles["report_type_font"])])
         
-        ws_meta['A7'] = "Longitude:"
-        ws_meta['B7'] = weather_data.get("longitude", "N/A")
+        # Data section starts at row 6
+        ws.append([])
+        ws.append([
+            styled(header, fill=header_fill, font=header_font_white, border=thin_border, alignment=header_alignment)
+            for header in headers
+        ])
         
-        ws_meta['A8'] = "Timezone:"
-        ws_meta['B8'] = weather_data.get("timezone", "N/A")
+        for row in rows:
+            ws.append([data_cell(value) for value in row])
         
-        ws_meta['A10'] = "Powered by IntelliWeather"
-        ws_meta['A10'].font = Font(italic=True)
+        # Add metadata sheet
+        ws_meta = wb.create_sheet("Metadata")
+        ws_meta.append([styled("IntelliWeather Report Metadata", ws_meta, font=title_font)])
+        ws_meta.append([])
+        ws_meta.append(["Data Source:", "Open-Meteo API"])
+        ws_meta.append(["Report Generated:", now.isoformat()])
+        ws_meta.append(["Location:", location])
+        ws_meta.append(["Latitude:", weather_data.get("latitude", "N/A")])
+        ws_meta.append(["Longitude:", weather_data.get("longitude", "N/A")])
+        ws_meta.append(["Timezone:", weather_data.get("timezone", "N/A")])
+        ws_meta.append([])
+        ws_meta.append([styled("Powered by IntelliWeather", ws_meta, font=styles["footer_font"])])
         
         # Save to bytes
         output = io.BytesIO()
@@ -197,60 +245,49 @@ class ExcelReportGenerator:
         """Generate CSV as fallback when openpyxl is not available."""
         import csv
         
-        output = io.StringIO()
-        writer = csv.writer(output)
-        
-        # Header
-        writer.writerow([f"IntelliWeather Report - {location}"])
-        writer.writerow([f"Generated: {datetime.now(timezone.utc).isoformat()}"])
-        writer.writerow([])
+        # Encode straight into the byte buffer instead of copying a str at the end
+        output = io.BytesIO()
+        text = io.TextIOWrapper(output, encoding='utf-8', newline='', write_through=True)
+        writer = csv.writer(text)
         
         if report_type == "hourly":
-            writer.writerow(["Time", "Temperature (°C)", "Humidity (%)", "Wind (m/s)", "Precip. Prob. (%)"])
-            for hour in weather_data.get("hourly", [])[:48]:
-                writer.writerow([
+            headers = ["Time", "Temperature (°C)", "Humidity (%)", "Wind (m/s)", "Precip. Prob. (%)"]
+            rows = [
+                (
                     hour.get("time", ""),
                     hour.get("temperature"),
                     hour.get("humidity"),
                     hour.get("wind_speed"),
                     hour.get("precipitation_probability")
-                ])
+                )
+                for hour in weather_data.get("hourly", [])[:48]
+            ]
         else:
-            writer.writerow(["Date", "Max Temp (°C)", "Min Temp (°C)", "Precipitation (mm)", "Weather"])
-            for day in weather_data.get("daily", []):
-                writer.writerow([
+            headers = ["Date", "Max Temp (°C)", "Min Temp (°C)", "Precipitation (mm)", "Weather"]
+            rows = [
+                (
                     day.get("date"),
                     day.get("temperature_max"),
                     day.get("temperature_min"),
                     day.get("precipitation_sum"),
                     self._get_condition(day.get("weather_code", 0))
-                ])
+                )
+                for day in weather_data.get("daily", [])
+            ]
+        
+        writer.writerows([
+            [f"IntelliWeather Report - {location}"],
+            [f"Generated: {datetime.now(timezone.utc).isoformat()}"],
+            [],
+            headers
+        ])
+        writer.writerows(rows)
         
-        return output.getvalue().encode('utf-8')
+        text.detach()
+        return output.getvalue()
     
     def _get_condition(self, code: int) -> str:
         """Get text description for weather code."""
-        conditions = {
-            0: "Clear",
-            1: "Mostly Clear",
-            2: "Partly Cloudy",
-            3: "Overcast",
-            45: "Foggy",
-            48: "Fog",
-            51: "Light Drizzle",
-            53: "Drizzle",
-            55: "Heavy Drizzle",
-            61: "Light Rain",
-            63: "Rain",
-            65: "Heavy Rain",
-            71: "Light Snow",
-            73: "Snow",
-            75: "Heavy Snow",
-            80: "Rain Showers",
-            81: "Heavy Showers",
-            82: "Violent Showers",
-            95: "Thunderstorm",
-            96: "T-Storm + Hail",
-            99: "Severe T-Storm"
-        }
-        return conditions.get(code, "Unknown")
+        if isinstance(code, int) and 0 <= code < len(_COND_TABLE):
+            return _COND_TABLE[code]
+        return _WEATHER_CONDITIONS.get(code, "Unknown")
@@ -15,12 +15,16 @@ Data sources:
 - Astronomical calculations for sun position
 """
 
-import requests
 import math
-from typing import Dict, List, Optional, Any
+import numpy as np
+from typing import Dict, List, Optional, Any, Tuple
 from datetime import datetime, timedelta
 from enum import Enum
 
+from cache import get_cache
+from http_client import decode_json, get_async_client
+from jit import njit
+
 
 class SkyCondition(str, Enum):
     """Sky condition classifications"""
@@ -40,89 +44,114 @@ class SolarPotential(str, Enum):
     VERY_POOR = "very_poor"
 
 
-def calculate_sun_position(latitude: float, longitude: float, timestamp: datetime) -> Dict[str, Any]:
-    """
-    Calculate sun position (azimuth and elevation) for given location and time
-    
-    Uses astronomical formulas from NOAA Solar Calculator
-    
-    Args:
-        latitude: Location latitude in degrees
-        longitude: Location longitude in degrees
-        timestamp: UTC datetime
-        
-    Returns:
-        Dictionary with sun azimuth, elevation, and related data
-    """
-    
-    # Convert to radians
-    lat_rad = math.radians(latitude)
+@njit(cache=True)
+def _julian_century_from_fields(year: int, month: int, day: int, hour: int, minute: int, second: float) -> float:
+    """Julian centuries since J2000.0 for UTC calendar fields"""
     
     # Calculate Julian Day
-    a = (14 - timestamp.month) // 12
-    y = timestamp.year + 4800 - a
-    m = timestamp.month + 12 * a - 3
+    a = (14 - month) // 12
+    y = year + 4800 - a
+    m = month + 12 * a - 3
+    
+    jd = day + (153 * m + 2) // 5 + 365 * y + y // 4 - y // 100 + y // 400 - 32045
+    jd += (hour - 12) / 24 + minute / 1440 + second / 86400
     
-    jd = timestamp.day + (153 * m + 2) // 5 + 365 * y + y // 4 - y // 100 + y // 400 - 32045
-    jd += (timestamp.hour - 12) / 24 + timestamp.minute / 1440 + timestamp.second / 86400
+    return (jd - 2451545) / 36525
+
+
+@njit(cache=True)
+def _declination_and_equation_of_time(jc: float) -> Tuple[float, float]:
+    """
+    Sun declination (degrees) and equation of time (minutes)
     
-    # Calculate Julian Century
-    jc = (jd - 2451545) / 36525
+    NOAA Solar Calculator formulas for a given Julian century.
+    """
     
-    # Calculate sun declination
     mean_long = (280.46646 + jc * (36000.76983 + jc * 0.0003032)) % 360
     mean_anom = 357.52911 + jc * (35999.05029 - 0.0001537 * jc)
     mean_anom_rad = math.radians(mean_anom)
-    
-    sun_eq = math.sin(mean_anom_rad) * (1.914602 - jc * (0.004817 + 0.000014 * jc)) + \
-             math.sin(2 * mean_anom_rad) * (0.019993 - 0.000101 * jc) + \
+    eccentricity = 0.016708634 - jc * (0.000042037 + 0.0000001267 * jc)
+    
+    # Shared trig terms (sin 4x = 2 sin 2x cos 2x)
+    sin_anom = math.sin(mean_anom_rad)
+    sin_2anom = math.sin(2 * mean_anom_rad)
+    omega_rad = math.radians(125.04 - 1934.136 * jc)
+    two_long_rad = math.radians(2 * mean_long)
+    sin_2long = math.sin(two_long_rad)
+    cos_2long = math.cos(two_long_rad)
+    sin_4long = 2 * sin_2long * cos_2long
+    
+    sun_eq = sin_anom * (1.914602 - jc * (0.004817 + 0.000014 * jc)) + \
+             sin_2anom * (0.019993 - 0.000101 * jc) + \
              math.sin(3 * mean_anom_rad) * 0.000289
     
     sun_true_long = mean_long + sun_eq
-    sun_app_long = sun_true_long - 0.00569 - 0.00478 * math.sin(math.radians(125.04 - 1934.136 * jc))
+    sun_app_long = sun_true_long - 0.00569 - 0.00478 * math.sin(omega_rad)
     
     obliq_corr = 23 + (26 + ((21.448 - jc * (46.815 + jc * (0.00059 - jc * 0.001813)))) / 60) / 60
-    obliq_corr += 0.00256 * math.cos(math.radians(125.04 - 1934.136 * jc))
+    obliq_corr += 0.00256 * math.cos(omega_rad)
+    obliq_rad = math.radians(obliq_corr)
     
-    sun_decl = math.degrees(math.asin(math.sin(math.radians(obliq_corr)) * math.sin(math.radians(sun_app_long))))
-    sun_decl_rad = math.radians(sun_decl)
+    sun_decl = math.degrees(math.asin(math.sin(obliq_rad) * math.sin(math.radians(sun_app_long))))
     
     # Calculate equation of time
-    var_y = math.tan(math.radians(obliq_corr / 2)) ** 2
+    var_y = math.tan(obliq_rad / 2) ** 2
     eq_of_time = 4 * math.degrees(
-        var_y * math.sin(2 * math.radians(mean_long)) -
-        2 * math.radians(mean_anom) * var_y +
-        4 * math.radians(mean_anom) * var_y * math.sin(2 * math.radians(mean_long)) -
-        0.5 * var_y * var_y * math.sin(4 * math.radians(mean_long)) -
-        1.25 * mean_anom_rad * mean_anom_rad
+        var_y * sin_2long -
+        2 * eccentricity * sin_anom +
+        4 * eccentricity * var_y * sin_anom * cos_2long -
+        0.5 * var_y * var_y * sin_4long -
+        1.25 * eccentricity * eccentricity * sin_2anom
     )
     
+    return sun_decl, eq_of_time
+
+
+@njit(cache=True)
+def _sun_position_core(latitude: float, longitude: float, year: int, month: int, day: int,
+                       hour: int, minute: int, second: float) -> Tuple[float, float]:
+    """
+    Refraction-corrected sun azimuth and elevation in degrees
+    
+    Pure numeric kernel behind calculate_sun_position, compiled with Numba
+    when it is installed.
+    """
+    
+    # Convert to radians
+    lat_rad = math.radians(latitude)
+    
+    # Sun declination and equation of time
+    jc = _julian_century_from_fields(year, month, day, hour, minute, second)
+    sun_decl, eq_of_time = _declination_and_equation_of_time(jc)
+    sun_decl_rad = math.radians(sun_decl)
+    
     # Calculate hour angle
-    true_solar_time = (timestamp.hour * 60 + timestamp.minute + timestamp.second / 60 + eq_of_time + 4 * longitude) % 1440
-    hour_angle = (true_solar_time / 4 - 180) if true_solar_time < 0 else (true_solar_time / 4 - 180)
+    true_solar_time = (hour * 60 + minute + second / 60 + eq_of_time + 4 * longitude) % 1440
+    hour_angle = true_solar_time / 4 - 180
     hour_angle_rad = math.radians(hour_angle)
     
     # Calculate solar elevation
-    solar_elevation_rad = math.asin(
+    solar_elevation_rad = math.asin(max(-1.0, min(1.0,
         math.sin(lat_rad) * math.sin(sun_decl_rad) +
         math.cos(lat_rad) * math.cos(sun_decl_rad) * math.cos(hour_angle_rad)
-    )
+    )))
     solar_elevation = math.degrees(solar_elevation_rad)
     
     # Calculate solar azimuth
-    solar_azimuth_rad = math.acos(
-        (math.sin(sun_decl_rad) * math.cos(lat_rad) -
-         math.cos(sun_decl_rad) * math.sin(lat_rad) * math.cos(hour_angle_rad)) /
-        math.cos(solar_elevation_rad)
-    ) if solar_elevation_rad != 0 else 0
+    solar_azimuth = 0.0
+    if solar_elevation_rad != 0:
+        solar_azimuth = math.degrees(math.acos(max(-1.0, min(1.0,
+            (math.sin(sun_decl_rad) * math.cos(lat_rad) -
+             math.cos(sun_decl_rad) * math.sin(lat_rad) * math.cos(hour_angle_rad)) /
+            math.cos(solar_elevation_rad)
+        ))))
     
-    solar_azimuth = math.degrees(solar_azimuth_rad)
     if hour_angle > 0:
         solar_azimuth = 360 - solar_azimuth
     
     # Atmospheric refraction correction
     if solar_elevation > -0.833:
-        refraction = 0
+        refraction = 0.0
         if solar_elevation <= 85:
             te = math.tan(math.radians(solar_elevation))
             if solar_elevation > 5:
@@ -134,6 +163,30 @@ def calculate_sun_position(latitude: float, longitude: float, timestamp: datetim
             refraction /= 3600
         solar_elevation += refraction
     
+    return solar_azimuth, solar_elevation
+
+
+def calculate_sun_position(latitude: float, longitude: float, timestamp: datetime) -> Dict[str, Any]:
+    """
+    Calculate sun position (azimuth and elevation) for given location and time
+    
+    Uses astronomical formulas from NOAA Solar Calculator
+    
+    Args:
+        latitude: Location latitude in degrees
+        longitude: Location longitude in degrees
+        timestamp: UTC datetime
+        
+    Returns:
+        Dictionary with sun azimuth, elevation, and related data
+    """
+    
+    solar_azimuth, solar_elevation = _sun_position_core(
+        latitude, longitude,
+        timestamp.year, timestamp.month, timestamp.day,
+        timestamp.hour, timestamp.minute, timestamp.second
+    )
+    
     return {
         "azimuth_deg": round(solar_azimuth, 2),
         "elevation_deg": round(solar_elevation, 2),
@@ -143,57 +196,98 @@ def calculate_sun_position(latitude: float, longitude: float, timestamp: datetim
     }
 
 
-def calculate_daylight_info(latitude: float, longitude: float, date: datetime.date) -> Dict[str, Any]:
+# Sun elevation at sunrise/sunset: refraction plus solar disc radius
+SUNRISE_ELEVATION_DEG = -0.833
+
+
+@njit(cache=True)
+def _daylight_core(latitude: float, longitude: float, year: int, month: int, day: int) -> Tuple[float, float, float]:
     """
-    Calculate sunrise, sunset, and daylight duration
+    Solar noon, sunrise hour angle and noon elevation for a UTC date
     
-    Args:
-        latitude: Location latitude
-        longitude: Location longitude
-        date: Date for calculation
-        
-    Returns:
-        Sunrise, sunset, and daylight information
+    Returns solar noon in minutes after UTC midnight, the sunrise hour
+    angle in degrees (0 for polar night, 180 for polar day) and the
+    geometric sun elevation at noon.
     """
     
-    # Simplified calculation - scan through the day
-    sunrise = None
-    sunset = None
-    
-    for hour in range(24):
-        for minute in [0, 30]:
-            dt = datetime(date.year, date.month, date.day, hour, minute, 0)
-            sun_pos = calculate_sun_position(latitude, longitude, dt)
-            
-            if sun_pos["elevation_deg"] > 0:
-                if sunrise is None:
-                    sunrise = dt
-                sunset = dt
-    
-    if sunrise and sunset:
-        daylight_hours = (sunset - sunrise).total_seconds() / 3600
+    # Declination and equation of time at (approximate) local solar noon
+    noon_offset = 720 - 4 * longitude
+    jc = _julian_century_from_fields(year, month, day, 0, 0, 0.0) + noon_offset / 1440 / 36525
+    sun_decl, eq_of_time = _declination_and_equation_of_time(jc)
+    
+    noon_minutes = noon_offset - eq_of_time
+    
+    lat_rad = math.radians(latitude)
+    decl_rad = math.radians(sun_decl)
+    cos_hour_angle = (
+        (math.sin(math.radians(SUNRISE_ELEVATION_DEG)) - math.sin(lat_rad) * math.sin(decl_rad)) /
+        (math.cos(lat_rad) * math.cos(decl_rad))
+    )
+    
+    if cos_hour_angle >= 1:
+        # Polar night: the sun stays below the horizon
+        hour_angle = 0.0
+    elif cos_hour_angle <= -1:
+        # Polar day: the sun stays above the horizon
+        hour_angle = 180.0
     else:
-        daylight_hours = 0
+        hour_angle = math.degrees(math.acos(cos_hour_angle))
+    
+    # Sun elevation at solar noon
+    max_elevation = 90 - abs(latitude - sun_decl)
+    
+    return noon_minutes, hour_angle, max_elevation
+
+
+def _daylight_info(latitude: float, longitude: float, year: int, month: int, day: int) -> Dict[str, Any]:
+    """Daylight summary for calendar fields; see calculate_daylight_info"""
+    
+    noon_minutes, hour_angle, max_elevation = _daylight_core(latitude, longitude, year, month, day)
+    
+    midnight = datetime(year, month, day)
+    solar_noon = midnight + timedelta(seconds=round(noon_minutes * 60))
     
-    # Calculate solar noon (when sun is highest)
-    solar_noon = None
-    max_elevation = -90
-    for hour in range(24):
-        dt = datetime(date.year, date.month, date.day, hour, 0, 0)
-        sun_pos = calculate_sun_position(latitude, longitude, dt)
-        if sun_pos["elevation_deg"] > max_elevation:
-            max_elevation = sun_pos["elevation_deg"]
-            solar_noon = dt
+    if hour_angle <= 0:
+        sunrise = sunset = None
+        daylight_hours = 0
+    elif hour_angle >= 180:
+        sunrise = sunset = None
+        daylight_hours = 24
+    else:
+        sunrise = midnight + timedelta(seconds=round((noon_minutes - 4 * hour_angle) * 60))
+        sunset = midnight + timedelta(seconds=round((noon_minutes + 4 * hour_angle) * 60))
+        daylight_hours = 8 * hour_angle / 60
     
     return {
         "sunrise": sunrise.isoformat() + "Z" if sunrise else None,
         "sunset": sunset.isoformat() + "Z" if sunset else None,
-        "solar_noon": solar_noon.isoformat() + "Z" if solar_noon else None,
+        "solar_noon": solar_noon.isoformat() + "Z",
         "daylight_hours": round(daylight_hours, 2),
         "max_elevation_deg": round(max_elevation, 2)
     }
 
 
+def calculate_daylight_info(latitude: float, longitude: float, date: datetime.date) -> Dict[str, Any]:
+    """
+    Calculate sunrise, sunset, and daylight duration
+    
+    Uses the closed-form NOAA sunrise equation: the sunrise hour angle H0
+    satisfies cos(H0) = (sin(-0.833°) - sin(lat)·sin(decl)) / (cos(lat)·cos(decl)),
+    and sunrise/sunset fall 4·H0 minutes either side of solar noon. Times
+    are UTC and may fall on the neighbouring UTC date.
+    
+    Args:
+        latitude: Location latitude
+        longitude: Location longitude
+        date: Date for calculation
+        
+    Returns:
+        Sunrise, sunset, and daylight information
+    """
+    
+    return _daylight_info(latitude, longitude, date.year, date.month, date.day)
+
+
 def estimate_pv_yield(
     ghi: float,
     dni: float,
@@ -242,6 +336,24 @@ def estimate_pv_yield(
     }
 
 
+# (minimum score, rating, description), best first
+_POTENTIAL_TIERS = (
+    (80, SolarPotential.EXCELLENT, "Excellent solar conditions - ideal for PV generation"),
+    (60, SolarPotential.GOOD, "Good solar conditions - favorable for PV generation"),
+    (40, SolarPotential.FAIR, "Fair solar conditions - moderate PV generation expected"),
+    (20, SolarPotential.POOR, "Poor solar conditions - limited PV generation"),
+)
+_VERY_POOR_POTENTIAL = (SolarPotential.VERY_POOR, "Very poor solar conditions - minimal PV generation")
+
+# (cloud cover upper bound, sky condition), clearest first; beyond the last is overcast
+_SKY_TIERS = (
+    (10, SkyCondition.CLEAR),
+    (30, SkyCondition.MOSTLY_CLEAR),
+    (60, SkyCondition.PARTLY_CLOUDY),
+    (85, SkyCondition.MOSTLY_CLOUDY),
+)
+
+
 def assess_solar_potential(ghi: float, cloud_cover: float) -> Dict[str, Any]:
     """
     Assess solar energy potential based on irradiance and cloud cover
@@ -264,31 +376,16 @@ def assess_solar_potential(ghi: float, cloud_cover: float) -> Dict[str, Any]:
     final_score = max(0, ghi_score - cloud_penalty)
     
     # Classify potential
-    if final_score >= 80:
-        potential = SolarPotential.EXCELLENT
-        description = "Excellent solar conditions - ideal for PV generation"
-    elif final_score >= 60:
-        potential = SolarPotential.GOOD
-        description = "Good solar conditions - favorable for PV generation"
-    elif final_score >= 40:
-        potential = SolarPotential.FAIR
-        description = "Fair solar conditions - moderate PV generation expected"
-    elif final_score >= 20:
-        potential = SolarPotential.POOR
-        description = "Poor solar conditions - limited PV generation"
+    for threshold, potential, description in _POTENTIAL_TIERS:
+        if final_score >= threshold:
+            break
     else:
-        potential = SolarPotential.VERY_POOR
-        description = "Very poor solar conditions - minimal PV generation"
+        potential, description = _VERY_POOR_POTENTIAL
     
     # Classify sky condition
-    if cloud_cover < 10:
-        sky = SkyCondition.CLEAR
-    elif cloud_cover < 30:
-        sky = SkyCondition.MOSTLY_CLEAR
-    elif cloud_cover < 60:
-        sky = SkyCondition.PARTLY_CLOUDY
-    elif cloud_cover < 85:
-        sky = SkyCondition.MOSTLY_CLOUDY
+    for limit, sky in _SKY_TIERS:
+        if cloud_cover < limit:
+            break
     else:
         sky = SkyCondition.OVERCAST
     
@@ -302,10 +399,18 @@ def assess_solar_potential(ghi: float, cloud_cover: float) -> Dict[str, Any]:
     }
 
 
+# Raw upstream responses are reused for 15 minutes per ~1km grid cell
+SOLAR_FETCH_TTL = 900
+
+
 async def fetch_solar_radiation_data(latitude: float, longitude: float, days: int = 7) -> Dict[str, Any]:
     """
     Fetch solar radiation data from Open-Meteo
     
+    Successful responses are cached for SOLAR_FETCH_TTL seconds, keyed on
+    the location rounded to 2 decimals (~1km) and the forecast length, so
+    current conditions may lag the upstream model run by up to 15 minutes.
+    
     Args:
         latitude: Location latitude
         longitude: Location longitude
@@ -315,6 +420,14 @@ async def fetch_solar_radiation_data(latitude: float, longitude: float, days: in
         Solar radiation data
     """
     
+    days = min(days, 16)
+    cache = get_cache()
+    cache_key = f"solar:raw:{round(latitude, 2)}:{round(longitude, 2)}:{days}"
+    
+    cached = cache.get(cache_key)
+    if cached:
+        return cached
+    
     try:
         url = "https://api.open-meteo.com/v1/forecast"
         
@@ -331,14 +444,17 @@ async def fetch_solar_radiation_data(latitude: float, longitude: float, days: in
                 "cloud_cover"
             ]),
             "daily": "shortwave_radiation_sum,sunshine_duration",
-            "forecast_days": min(days, 16),
+            "forecast_days": days,
             "timezone": "auto"
         }
         
-        response = requests.get(url, params=params, timeout=10)
+        response = await get_async_client().get(url, params=params)
         response.raise_for_status()
         
-        return response.json()
+        data = decode_json(response)
+        cache.set(cache_key, data, ttl=SOLAR_FETCH_TTL)
+        
+        return data
         
     except Exception as e:
         return {
@@ -347,6 +463,42 @@ async def fetch_solar_radiation_data(latitude: float, longitude: float, days: in
         }
 
 
+def _safe_idx(seq: Optional[List[Any]], i: int, default: Any) -> Any:
+    """Element i of an hourly/daily series, or default if missing or null"""
+    if seq and i < len(seq):
+        value = seq[i]
+        if value:
+            return value
+    return default
+
+
+def _current_hour_index(times: List[str], now: datetime) -> int:
+    """
+    Index of the last hourly timestamp at or before now (0 if none)
+    
+    Open-Meteo returns contiguous hourly steps, so the index follows from
+    the first and last entries; anything irregular falls back to a scan.
+    """
+    
+    first = datetime.fromisoformat(times[0].replace('Z', '+00:00'))
+    last = datetime.fromisoformat(times[-1].replace('Z', '+00:00'))
+    
+    if last - first == timedelta(hours=len(times) - 1):
+        elapsed = now - first
+        if elapsed < timedelta(0):
+            return 0
+        return min(len(times) - 1, elapsed // timedelta(hours=1))
+    
+    current_index = 0
+    for i, time_str in enumerate(times):
+        time_dt = datetime.fromisoformat(time_str.replace('Z', '+00:00'))
+        if time_dt <= now:
+            current_index = i
+        else:
+            break
+    return current_index
+
+
 async def get_current_solar_conditions(latitude: float, longitude: float) -> Dict[str, Any]:
     """
     Get current solar radiation and energy conditions
@@ -383,20 +535,14 @@ async def get_current_solar_conditions(latitude: float, longitude: float) -> Dic
     
     # Find current hour
     now = datetime.utcnow()
-    current_index = 0
-    for i, time_str in enumerate(times):
-        time_dt = datetime.fromisoformat(time_str.replace('Z', '+00:00'))
-        if time_dt <= now:
-            current_index = i
-        else:
-            break
+    current_index = _current_hour_index(times, now)
     
     # Extract current values
-    ghi = hourly.get("shortwave_radiation", [0] * len(times))[current_index] or 0  # W/m²
-    dni = hourly.get("direct_normal_irradiance", [0] * len(times))[current_index] or 0
-    dhi = hourly.get("diffuse_radiation", [0] * len(times))[current_index] or 0
-    temperature = hourly.get("temperature_2m", [20] * len(times))[current_index] or 20
-    cloud_cover = hourly.get("cloud_cover", [0] * len(times))[current_index] or 0
+    ghi = _safe_idx(hourly.get("shortwave_radiation"), current_index, 0)  # W/m²
+    dni = _safe_idx(hourly.get("direct_normal_irradiance"), current_index, 0)
+    dhi = _safe_idx(hourly.get("diffuse_radiation"), current_index, 0)
+    temperature = _safe_idx(hourly.get("temperature_2m"), current_index, 20)
+    cloud_cover = _safe_idx(hourly.get("cloud_cover"), current_index, 0)
     
     # Calculate sun position
     sun_position = calculate_sun_position(latitude, longitude, now)
@@ -436,6 +582,58 @@ async def get_current_solar_conditions(latitude: float, longitude: float) -> Dic
     }
 
 
+def _hourly_array(hourly: Dict[str, Any], key: str, length: int) -> np.ndarray:
+    """Hourly variable as a float array with missing values set to 0"""
+    values = hourly.get(key)
+    if not values:
+        return np.zeros(length)
+    return np.nan_to_num(np.array(values, dtype=np.float64), nan=0.0)
+
+
+def _daily_peak_hours(hourly: Dict[str, Any], dates: List[str]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Peak irradiance and the cloud cover at that hour for each forecast day
+    
+    Open-Meteo returns 24 hourly values per daily entry, so the hourly
+    series is reshaped to (days, 24) and reduced per row. Days without any
+    irradiance report a cloud cover of 0.
+    
+    Args:
+        hourly: Open-Meteo hourly block
+        dates: Daily forecast dates (YYYY-MM-DD)
+        
+    Returns:
+        Tuple of (peak GHI, cloud cover at peak) arrays, one entry per date
+    """
+    
+    n_days = len(dates)
+    hourly_times = hourly.get("time", [])
+    
+    if len(hourly_times) == n_days * 24:
+        ghi = _hourly_array(hourly, "shortwave_radiation", len(hourly_times)).reshape(n_days, 24)
+        cloud = _hourly_array(hourly, "cloud_cover", len(hourly_times)).reshape(n_days, 24)
+    else:
+        # Irregular hourly block: place each hour into its day's row
+        ghi = np.zeros((n_days, 24))
+        cloud = np.zeros((n_days, 24))
+        day_index = {date_str: i for i, date_str in enumerate(dates)}
+        ghi_values = _hourly_array(hourly, "shortwave_radiation", len(hourly_times))
+        cloud_values = _hourly_array(hourly, "cloud_cover", len(hourly_times))
+        for j, time_str in enumerate(hourly_times):
+            i = day_index.get(time_str[:10])
+            if i is not None and len(time_str) >= 13:
+                hour = int(time_str[11:13])
+                if ghi_values[j] > ghi[i, hour]:
+                    ghi[i, hour] = ghi_values[j]
+                    cloud[i, hour] = cloud_values[j]
+    
+    peak_idx = ghi.argmax(axis=1)
+    peak_ghi = ghi[np.arange(n_days), peak_idx]
+    peak_cloud = np.where(peak_ghi > 0, cloud[np.arange(n_days), peak_idx], 0.0)
+    
+    return peak_ghi, peak_cloud
+
+
 async def get_daily_solar_forecast(latitude: float, longitude: float, days: int = 7) -> Dict[str, Any]:
     """
     Get daily solar energy forecast
@@ -466,33 +664,28 @@ async def get_daily_solar_forecast(latitude: float, longitude: float, days: int
             "message": "No solar forecast available"
         }
     
-    hourly = solar_data.get("hourly", {})
-    hourly_times = hourly.get("time", [])
+    radiation_sums = daily.get("shortwave_radiation_sum")
+    sunshine_durations = daily.get("sunshine_duration")
+    peak_ghis, peak_clouds = _daily_peak_hours(solar_data.get("hourly", {}), dates)
     
     forecast = []
     
     for i, date_str in enumerate(dates):
         # Get daily aggregates
-        total_radiation = daily.get("shortwave_radiation_sum", [0] * len(dates))[i] or 0  # MJ/m²
-        sunshine_duration = daily.get("sunshine_duration", [0] * len(dates))[i] or 0  # seconds
+        total_radiation = _safe_idx(radiation_sums, i, 0)  # MJ/m²
+        sunshine_duration = _safe_idx(sunshine_durations, i, 0)  # seconds
         
         # Convert to kWh/m²
         daily_kwh = total_radiation * 0.277778  # 1 MJ = 0.277778 kWh
         
-        # Calculate daylight info for this day
-        date_obj = datetime.fromisoformat(date_str).date()
-        daylight_info = calculate_daylight_info(latitude, longitude, date_obj)
+        # Calculate daylight info for this day (date_str is YYYY-MM-DD)
+        daylight_info = _daylight_info(
+            latitude, longitude, int(date_str[:4]), int(date_str[5:7]), int(date_str[8:10])
+        )
         
-        # Find peak hour data for this day
-        peak_ghi = 0
-        peak_cloud_cover = 0
-        
-        for j, time_str in enumerate(hourly_times):
-            if time_str.startswith(date_str):
-                ghi = hourly.get("shortwave_radiation", [0] * len(hourly_times))[j] or 0
-                if ghi > peak_ghi:
-                    peak_ghi = ghi
-                    peak_cloud_cover = hourly.get("cloud_cover", [0] * len(hourly_times))[j] or 0
+        # Peak hour data for this day
+        peak_ghi = float(peak_ghis[i])
+        peak_cloud_cover = float(peak_clouds[i])
         
         # Assess potential
         solar_assessment = assess_solar_potential(peak_ghi, peak_cloud_cover)
@@ -4,8 +4,11 @@ Subscription Tiers and API Key Tier Management - Simplified
 Defines subscription tiers with different rate limits and features.
 """
 
+from dataclasses import dataclass, field
 from enum import Enum
-from typing import Dict, List
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, Mapping, Tuple
 
 
 class SubscriptionTier(str, Enum):
@@ -16,32 +19,28 @@ class SubscriptionTier(str, Enum):
     ENTERPRISE = "enterprise"
 
 
+@dataclass(frozen=True, slots=True)
 class TierLimits:
     """Rate limits and features for a subscription tier."""
     
-    def __init__(
-        self,
-        name: str,
-        display_name: str,
-        requests_per_hour: int,
-        requests_per_day: int,
-        requests_per_month: int,
-        max_api_keys: int,
-        price_monthly: float,
-        features: List[str]
-    ):
-        self.name = name
-        self.display_name = display_name
-        self.requests_per_hour = requests_per_hour
-        self.requests_per_day = requests_per_day
-        self.requests_per_month = requests_per_month
-        self.max_api_keys = max_api_keys
-        self.price_monthly = price_monthly
-        self.features = features
+    name: str
+    display_name: str
+    requests_per_hour: int
+    requests_per_day: int
+    requests_per_month: int
+    max_api_keys: int
+    price_monthly: float
+    features: Tuple[str, ...]
+    
+    # Derived limit, fixed once the tier is built
+    requests_per_minute: int = field(init=False, repr=False)
+    
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "requests_per_minute", self.requests_per_hour // 60)
     
     def get_rate_limit_per_minute(self) -> int:
-        """Calculate requests per minute from hourly limit."""
-        return self.requests_per_hour // 60
+        """Get requests per minute derived from the hourly limit."""
+        return self.requests_per_minute
     
     def is_within_hourly_limit(self, requests: int) -> bool:
         """Check if request count is within hourly limit."""
@@ -65,12 +64,12 @@ TIER_CONFIGS = {
         "requests_per_month": 10000,
         "max_api_keys": 2,
         "price_monthly": 0.0,
-        "features": [
+        "features": (
             "Basic weather data",
             "7-day forecast",
             "Hourly updates",
             "Community support"
-        ]
+        )
     },
     "pro": {
         "display_name": "Pro",
@@ -79,14 +78,14 @@ TIER_CONFIGS = {
         "requests_per_month": 250000,
         "max_api_keys": 10,
         "price_monthly": 29.0,
-        "features": [
+        "features": (
             "All Free features",
             "Extended forecasts (16 days)",
             "Pollen & air quality data",
             "Solar & marine weather",
             "Priority support",
             "99.5% uptime SLA"
-        ]
+        )
     },
     "business": {
         "display_name": "Business",
@@ -95,7 +94,7 @@ TIER_CONFIGS = {
         "requests_per_month": 1000000,
         "max_api_keys": 50,
         "price_monthly": 99.0,
-        "features": [
+        "features": (
             "All Pro features",
             "Bulk weather API",
             "Historical data access",
@@ -104,7 +103,7 @@ TIER_CONFIGS = {
             "Custom integrations",
             "Priority support",
             "99.9% uptime SLA"
-        ]
+        )
     },
     "enterprise": {
         "display_name": "Enterprise",
@@ -113,7 +112,7 @@ TIER_CONFIGS = {
         "requests_per_month": 5000000,
         "max_api_keys": 200,
         "price_monthly": 499.0,
-        "features": [
+        "features": (
             "All Business features",
             "Dedicated infrastructure",
             "Custom rate limits",
@@ -123,21 +122,24 @@ TIER_CONFIGS = {
             "24/7 phone support",
             "99.99% uptime SLA",
             "Custom contracts"
-        ]
+        )
     }
 }
 
 
+# One shared TierLimits per tier, built at import time
+_TIER_LIMITS_CACHE: Dict[str, TierLimits] = {
+    tier_key: TierLimits(name=tier_key, **config)
+    for tier_key, config in TIER_CONFIGS.items()
+}
+
+
 def get_tier_limits(tier: SubscriptionTier) -> TierLimits:
     """Get tier limits for a subscription tier."""
-    tier_key = tier.value if isinstance(tier, SubscriptionTier) else tier
-    config = TIER_CONFIGS[tier_key]
-    return TierLimits(
-        name=tier_key,
-        **config
-    )
+    return _TIER_LIMITS_CACHE[tier.value if isinstance(tier, SubscriptionTier) else tier]
 
 
+@lru_cache(maxsize=8)
 def get_tier_from_string(tier_str: str) -> SubscriptionTier:
     """Convert string to SubscriptionTier enum."""
     try:
@@ -146,6 +148,6 @@ def get_tier_from_string(tier_str: str) -> SubscriptionTier:
         return SubscriptionTier.FREE
 
 
-def get_all_tiers() -> Dict:
-    """Get all tier information for display."""
-    return TIER_CONFIGS.copy()
+def get_all_tiers() -> Mapping:
+    """Get all tier information for display (read-only view)."""
+    return MappingProxyType(TIER_CONFIGS)
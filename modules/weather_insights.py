@@ -14,26 +14,21 @@ These are computed from raw weather data, not API-dependent.
 """
 
 import math
-from typing import Optional, Dict, Tuple
+from bisect import bisect_left, bisect_right
+from functools import lru_cache
+from typing import Optional, Dict, Tuple, Sequence
 from datetime import datetime
 
+import numpy as np
+
+from jit import njit
+
 
 # ==================== TEMPERATURE FEELS-LIKE CALCULATIONS ====================
 
-def calculate_heat_index(temp_c: float, humidity: float) -> float:
-    """
-    Calculate heat index (feels-like temperature in hot conditions).
-    
-    Uses Rothfusz regression (NWS formula).
-    Accurate for temperatures > 27°C (80°F) and humidity > 40%.
-    
-    Args:
-        temp_c: Temperature in Celsius
-        humidity: Relative humidity (0-100)
-    
-    Returns:
-        Heat index in Celsius
-    """
+@njit(cache=True)
+def _heat_index_core(temp_c: float, humidity: float) -> float:
+    """Rothfusz heat index in Celsius (numeric kernel)."""
     # Convert to Fahrenheit for calculation
     temp_f = temp_c * 9/5 + 32
     
@@ -55,8 +50,10 @@ def calculate_heat_index(temp_c: float, humidity: float) -> float:
     T = temp_f
     RH = humidity
     
-    HI = (c1 + c2*T + c3*RH + c4*T*RH + c5*T*T + c6*RH*RH + 
-          c7*T*T*RH + c8*T*RH*RH + c9*T*T*RH*RH)
+    # Rothfusz polynomial factored around the shared T*RH term
+    T_RH = T * RH
+    HI = (c1 + T * (c2 + c5*T + c7*T_RH + c9*T_RH*RH) +
+          RH * (c3 + c4*T + c6*RH + c8*T_RH))
     
     # Adjustments
     if RH < 13 and 80 <= T <= 112:
@@ -70,87 +67,217 @@ def calculate_heat_index(temp_c: float, humidity: float) -> float:
     return (HI - 32) * 5/9
 
 
-def calculate_wind_chill(temp_c: float, wind_speed_kmh: float) -> float:
+def calculate_heat_index(temp_c: float, humidity: float) -> float:
     """
-    Calculate wind chill (feels-like temperature in cold, windy conditions).
+    Calculate heat index (feels-like temperature in hot conditions).
     
-    Uses NWS/Environment Canada formula.
-    Accurate for temperatures < 10°C and wind speeds > 4.8 km/h.
+    Uses Rothfusz regression (NWS formula).
+    Accurate for temperatures > 27°C (80°F) and humidity > 40%.
     
     Args:
         temp_c: Temperature in Celsius
-        wind_speed_kmh: Wind speed in km/h
+        humidity: Relative humidity (0-100)
     
     Returns:
-        Wind chill in Celsius
+        Heat index in Celsius
     """
+    return _heat_index_core(temp_c, humidity)
+
+
+@njit(cache=True)
+def _wind_chill_core(temp_c: float, wind_speed_kmh: float) -> float:
+    """NWS/Environment Canada wind chill in Celsius (numeric kernel)."""
     if temp_c > 10 or wind_speed_kmh < 4.8:
         return temp_c
     
-    # Wind chill formula (metric)
-    WC = (13.12 + 0.6215*temp_c - 11.37*math.pow(wind_speed_kmh, 0.16) + 
-          0.3965*temp_c*math.pow(wind_speed_kmh, 0.16))
+    # Wind chill formula (metric), with the V^0.16 terms collected
+    wind_factor = math.pow(wind_speed_kmh, 0.16)
+    WC = 13.12 + 0.6215*temp_c + (0.3965*temp_c - 11.37) * wind_factor
     
     return WC
 
 
-def calculate_wet_bulb_temperature(temp_c: float, humidity: float, pressure_hpa: float = 1013.25) -> float:
+def calculate_wind_chill(temp_c: float, wind_speed_kmh: float) -> float:
     """
-    Calculate wet bulb temperature using Stull's formula.
+    Calculate wind chill (feels-like temperature in cold, windy conditions).
     
-    Wet bulb temperature is critical for:
-    - Heat stress assessment
-    - HVAC calculations
-    - Agricultural planning
+    Uses NWS/Environment Canada formula.
+    Accurate for temperatures < 10°C and wind speeds > 4.8 km/h.
     
     Args:
         temp_c: Temperature in Celsius
-        humidity: Relative humidity (0-100)
-        pressure_hpa: Atmospheric pressure in hPa (default: sea level)
+        wind_speed_kmh: Wind speed in km/h
     
     Returns:
-        Wet bulb temperature in Celsius
+        Wind chill in Celsius
     """
+    return _wind_chill_core(temp_c, wind_speed_kmh)
+
+
+@njit(cache=True)
+def _wet_bulb_core(temp_c: float, humidity: float) -> float:
+    """Stull wet bulb temperature in Celsius (numeric kernel)."""
     T = temp_c
     RH = humidity
     
     # Stull's formula (simplified, accurate within 1°C)
+    # RH**1.5 as RH*sqrt(RH)
     Tw = (T * math.atan(0.151977 * math.sqrt(RH + 8.313659)) +
           math.atan(T + RH) - math.atan(RH - 1.676331) +
-          0.00391838 * math.pow(RH, 1.5) * math.atan(0.023101 * RH) - 4.686035)
+          0.00391838 * RH * math.sqrt(RH) * math.atan(0.023101 * RH) - 4.686035)
     
     return Tw
 
 
-# ==================== RISK SCORING ====================
-
-def calculate_fire_risk_score(
-    temp_c: float,
-    humidity: float,
-    wind_speed_kmh: float,
-    precipitation_mm: float = 0,
-    days_since_rain: int = 0
-) -> Dict[str, any]:
+def calculate_wet_bulb_temperature(temp_c: float, humidity: float, pressure_hpa: float = 1013.25) -> float:
     """
-    Calculate fire risk score based on weather conditions.
+    Calculate wet bulb temperature using Stull's formula.
     
-    Returns score 0-100 where:
-    - 0-20: Low risk
-    - 21-40: Moderate risk
-    - 41-60: High risk
-    - 61-80: Very high risk
-    - 81-100: Extreme risk
+    Wet bulb temperature is critical for:
+    - Heat stress assessment
+    - HVAC calculations
+    - Agricultural planning
     
     Args:
         temp_c: Temperature in Celsius
         humidity: Relative humidity (0-100)
-        wind_speed_kmh: Wind speed in km/h
-        precipitation_mm: Recent precipitation
-        days_since_rain: Days since last significant rain
+        pressure_hpa: Atmospheric pressure in hPa (default: sea level)
     
     Returns:
-        Dict with score, category, and recommendations
+        Wet bulb temperature in Celsius
     """
+    return _wet_bulb_core(temp_c, humidity)
+
+
+# ==================== SCORING TABLES ====================
+#
+# Band thresholds in ascending order with one entry per band, indexed
+# with bisect: bisect_right for ">=" / "<" bands, bisect_left for ">"
+# bands, so each lookup matches the boundary of the original ladder.
+
+# Fire risk score -> (category, recommendation)
+_FIRE_CATEGORY_THRESH = (21, 41, 61, 81)
+_FIRE_CATEGORIES = (
+    ("low", "Low fire danger. Normal precautions apply."),
+    ("moderate", "Moderate fire danger. Be cautious with outdoor activities involving fire."),
+    ("high", "High fire danger. Exercise caution with any heat sources."),
+    ("very_high", "Very high fire danger. Avoid any open flames. Monitor fire alerts closely."),
+    ("extreme", "Extreme fire danger. No outdoor burning. Be prepared for rapid fire spread."),
+)
+
+# Cloud-adjusted UV -> (level, color, recommendation, minutes to burn)
+_UV_LEVEL_THRESH = (3, 6, 8, 11)
+_UV_LEVELS = (
+    ("low", "green", "Low risk. Minimal protection needed. Sunglasses recommended if bright.", 60),
+    ("moderate", "yellow", "Moderate risk. Use sunscreen SPF 15+. Wear sunglasses on bright days.", 30),
+    ("high", "orange", "High risk. Seek shade during midday. Sunscreen SPF 30+, protective clothing advised.", 20),
+    ("very_high", "red", "Very high risk. Minimize sun exposure. Sunscreen SPF 30+, hat, and sunglasses required.", 15),
+    ("extreme", "violet", "Extreme risk. Avoid sun exposure 10am-4pm. Sunscreen SPF 50+, protective clothing required.", 10),
+)
+
+# Travel disruption bands -> (points, affected modes)
+_TRAVEL_PRECIP_THRESH = (5, 20, 50)  # mm, exceeded
+_TRAVEL_PRECIP_IMPACT = (
+    (0, ()),
+    (10, ("road",)),
+    (25, ("road", "rail")),
+    (40, ("road", "rail", "air")),
+)
+_TRAVEL_WIND_THRESH = (30, 50, 75)  # km/h, exceeded
+_TRAVEL_WIND_IMPACT = (
+    (0, ()),
+    (10, ("maritime",)),
+    (20, ("air", "maritime")),
+    (30, ("air", "maritime", "road")),
+)
+_TRAVEL_VISIBILITY_THRESH = (100, 500, 1000)  # m, below
+_TRAVEL_VISIBILITY_IMPACT = (
+    (30, ("road", "air", "maritime")),
+    (20, ("road", "air")),
+    (10, ("road",)),
+    (0, ()),
+)
+_TRAVEL_TEMP_THRESH = (-10, 0)  # °C, below
+_TRAVEL_TEMP_IMPACT = (
+    (15, ("road", "rail")),
+    (10, ("road",)),
+    (0, ()),
+)
+
+# WMO codes that add to travel disruption (thunderstorms, snow)
+SEVERE_WEATHER_CODES = (95, 96, 99, 71, 73, 75, 77, 85, 86)
+_SEVERE_CODES = frozenset(SEVERE_WEATHER_CODES)
+_SEVERE_AFFECTED = ("road", "rail", "air")
+
+# Travel disruption score -> (category, recommendation)
+_TRAVEL_CATEGORY_THRESH = (10, 30, 50, 70)
+_TRAVEL_CATEGORIES = (
+    ("minimal", "Minimal disruption expected. Normal conditions."),
+    ("minor", "Minor delays possible. Exercise normal caution."),
+    ("moderate", "Moderate disruption possible. Allow extra time and check conditions."),
+    ("major", "Major disruption likely. Delay travel if possible."),
+    ("severe", "Severe disruption expected. Avoid all non-essential travel."),
+)
+
+# Precipitation probability -> base confidence; confidence -> interpretation
+_RAIN_PROBABILITY_THRESH = (20, 40, 60, 80)
+_RAIN_BASE_CONFIDENCE = (30, 40, 55, 70, 85)
+_RAIN_CONFIDENCE_THRESH = (40, 60, 80)
+_RAIN_INTERPRETATIONS = (
+    "Low confidence in forecast",
+    "Moderate confidence in forecast",
+    "High confidence in forecast",
+    "Very high confidence in forecast",
+)
+
+# Comfort score -> (category, description)
+_COMFORT_CATEGORY_THRESH = (20, 40, 60, 80)
+_COMFORT_CATEGORIES = (
+    ("very_uncomfortable", "Very uncomfortable conditions, avoid prolonged outdoor exposure"),
+    ("uncomfortable", "Uncomfortable conditions, limit outdoor exposure"),
+    ("moderate", "Tolerable conditions"),
+    ("comfortable", "Pleasant conditions"),
+    ("very_comfortable", "Excellent conditions for outdoor activities"),
+)
+
+
+# Scores are small integers, so the category lookups are memoized per score
+
+@lru_cache(maxsize=128)
+def _fire_category(score: int) -> Tuple[str, str]:
+    """(category, recommendation) for a fire risk score."""
+    return _FIRE_CATEGORIES[bisect_right(_FIRE_CATEGORY_THRESH, score)]
+
+
+@lru_cache(maxsize=128)
+def _travel_category(score: int) -> Tuple[str, str]:
+    """(category, recommendation) for a travel disruption score."""
+    return _TRAVEL_CATEGORIES[bisect_right(_TRAVEL_CATEGORY_THRESH, score)]
+
+
+@lru_cache(maxsize=128)
+def _rain_interpretation(confidence: int) -> str:
+    """Interpretation text for a rain confidence score."""
+    return _RAIN_INTERPRETATIONS[bisect_right(_RAIN_CONFIDENCE_THRESH, confidence)]
+
+
+@lru_cache(maxsize=128)
+def _comfort_category(score: int) -> Tuple[str, str]:
+    """(category, description) for a comfort score."""
+    return _COMFORT_CATEGORIES[bisect_right(_COMFORT_CATEGORY_THRESH, score)]
+
+
+# ==================== RISK SCORING ====================
+
+@njit(cache=True)
+def _fire_risk_points(
+    temp_c: float,
+    humidity: float,
+    wind_speed_kmh: float,
+    precipitation_mm: float,
+    days_since_rain: int
+) -> int:
+    """Uncapped fire risk points (numeric kernel of calculate_fire_risk_score)."""
     score = 0
     
     # Temperature factor (0-30 points)
@@ -194,22 +321,40 @@ def calculate_fire_risk_score(
     else:
         score = max(0, score - 10)  # Recent rain reduces risk
     
+    return score
+
+
+def calculate_fire_risk_score(
+    temp_c: float,
+    humidity: float,
+    wind_speed_kmh: float,
+    precipitation_mm: float = 0,
+    days_since_rain: int = 0
+) -> Dict[str, any]:
+    """
+    Calculate fire risk score based on weather conditions.
+    
+    Returns score 0-100 where:
+    - 0-20: Low risk
+    - 21-40: Moderate risk
+    - 41-60: High risk
+    - 61-80: Very high risk
+    - 81-100: Extreme risk
+    
+    Args:
+        temp_c: Temperature in Celsius
+        humidity: Relative humidity (0-100)
+        wind_speed_kmh: Wind speed in km/h
+        precipitation_mm: Recent precipitation
+        days_since_rain: Days since last significant rain
+    
+    Returns:
+        Dict with score, category, and recommendations
+    """
+    score = _fire_risk_points(temp_c, humidity, wind_speed_kmh, precipitation_mm, days_since_rain)
+    
     # Determine category
-    if score >= 81:
-        category = "extreme"
-        recommendation = "Extreme fire danger. No outdoor burning. Be prepared for rapid fire spread."
-    elif score >= 61:
-        category = "very_high"
-        recommendation = "Very high fire danger. Avoid any open flames. Monitor fire alerts closely."
-    elif score >= 41:
-        category = "high"
-        recommendation = "High fire danger. Exercise caution with any heat sources."
-    elif score >= 21:
-        category = "moderate"
-        recommendation = "Moderate fire danger. Be cautious with outdoor activities involving fire."
-    else:
-        category = "low"
-        recommendation = "Low fire danger. Normal precautions apply."
+    category, recommendation = _fire_category(score)
     
     return {
         "score": min(100, score),
@@ -235,31 +380,7 @@ def calculate_uv_exposure_score(uv_index: float, cloud_cover: float, time_of_day
     # Adjust UV for cloud cover (clouds reduce UV by ~20-90% depending on thickness)
     adjusted_uv = uv_index * (1 - (cloud_cover / 100) * 0.5)
     
-    if adjusted_uv >= 11:
-        level = "extreme"
-        color = "violet"
-        recommendation = "Extreme risk. Avoid sun exposure 10am-4pm. Sunscreen SPF 50+, protective clothing required."
-        minutes_to_burn = 10
-    elif adjusted_uv >= 8:
-        level = "very_high"
-        color = "red"
-        recommendation = "Very high risk. Minimize sun exposure. Sunscreen SPF 30+, hat, and sunglasses required."
-        minutes_to_burn = 15
-    elif adjusted_uv >= 6:
-        level = "high"
-        color = "orange"
-        recommendation = "High risk. Seek shade during midday. Sunscreen SPF 30+, protective clothing advised."
-        minutes_to_burn = 20
-    elif adjusted_uv >= 3:
-        level = "moderate"
-        color = "yellow"
-        recommendation = "Moderate risk. Use sunscreen SPF 15+. Wear sunglasses on bright days."
-        minutes_to_burn = 30
-    else:
-        level = "low"
-        color = "green"
-        recommendation = "Low risk. Minimal protection needed. Sunglasses recommended if bright."
-        minutes_to_burn = 60
+    level, color, recommendation, minutes_to_burn = _UV_LEVELS[bisect_right(_UV_LEVEL_THRESH, adjusted_uv)]
     
     return {
         "uv_index": uv_index,
@@ -300,75 +421,29 @@ def calculate_travel_disruption_risk(
     score = 0
     affected_modes = []
     
-    # Precipitation impact
-    if precipitation_mm > 50:
-        score += 40
-        affected_modes.extend(["road", "rail", "air"])
-    elif precipitation_mm > 20:
-        score += 25
-        affected_modes.extend(["road", "rail"])
-    elif precipitation_mm > 5:
-        score += 10
-        affected_modes.append("road")
-    
-    # Wind impact
-    if wind_speed_kmh > 75:
-        score += 30
-        affected_modes.extend(["air", "maritime", "road"])
-    elif wind_speed_kmh > 50:
-        score += 20
-        affected_modes.extend(["air", "maritime"])
-    elif wind_speed_kmh > 30:
-        score += 10
-        affected_modes.append("maritime")
-    
-    # Visibility impact
-    if visibility_m < 100:
-        score += 30
-        affected_modes.extend(["road", "air", "maritime"])
-    elif visibility_m < 500:
-        score += 20
-        affected_modes.extend(["road", "air"])
-    elif visibility_m < 1000:
-        score += 10
-        affected_modes.append("road")
-    
-    # Temperature impact (ice/snow)
-    if temp_c < -10:
-        score += 15
-        affected_modes.extend(["road", "rail"])
-    elif temp_c < 0:
-        score += 10
-        affected_modes.append("road")
+    # Precipitation, wind, visibility and temperature (ice/snow) impact
+    for points, modes in (
+        _TRAVEL_PRECIP_IMPACT[bisect_left(_TRAVEL_PRECIP_THRESH, precipitation_mm)],
+        _TRAVEL_WIND_IMPACT[bisect_left(_TRAVEL_WIND_THRESH, wind_speed_kmh)],
+        _TRAVEL_VISIBILITY_IMPACT[bisect_right(_TRAVEL_VISIBILITY_THRESH, visibility_m)],
+        _TRAVEL_TEMP_IMPACT[bisect_right(_TRAVEL_TEMP_THRESH, temp_c)],
+    ):
+        score += points
+        affected_modes.extend(modes)
     
     # Severe weather codes (thunderstorms, snow, etc.)
-    severe_codes = [95, 96, 99, 71, 73, 75, 77, 85, 86]
-    if weather_code in severe_codes:
+    if weather_code in _SEVERE_CODES:
         score += 20
-        affected_modes = list(set(affected_modes + ["road", "rail", "air"]))
+        affected_modes.extend(_SEVERE_AFFECTED)
     
     # Determine category
     score = min(100, score)
-    if score >= 70:
-        category = "severe"
-        recommendation = "Severe disruption expected. Avoid all non-essential travel."
-    elif score >= 50:
-        category = "major"
-        recommendation = "Major disruption likely. Delay travel if possible."
-    elif score >= 30:
-        category = "moderate"
-        recommendation = "Moderate disruption possible. Allow extra time and check conditions."
-    elif score >= 10:
-        category = "minor"
-        recommendation = "Minor delays possible. Exercise normal caution."
-    else:
-        category = "minimal"
-        recommendation = "Minimal disruption expected. Normal conditions."
+    category, recommendation = _travel_category(score)
     
     return {
         "score": score,
         "category": category,
-        "affected_modes": list(set(affected_modes)),
+        "affected_modes": list(dict.fromkeys(affected_modes)),
         "recommendation": recommendation
     }
 
@@ -394,19 +469,8 @@ def calculate_rain_confidence(
     Returns:
         Dict with confidence score and interpretation
     """
-    confidence = 0
-    
     # Base confidence from reported probability
-    if precipitation_probability >= 80:
-        confidence = 85
-    elif precipitation_probability >= 60:
-        confidence = 70
-    elif precipitation_probability >= 40:
-        confidence = 55
-    elif precipitation_probability >= 20:
-        confidence = 40
-    else:
-        confidence = 30
+    confidence = _RAIN_BASE_CONFIDENCE[bisect_right(_RAIN_PROBABILITY_THRESH, precipitation_probability)]
     
     # Adjust for supporting conditions
     if cloud_cover > 80 and humidity > 70:
@@ -422,17 +486,10 @@ def calculate_rain_confidence(
     elif precipitation_mm > 0 and precipitation_mm < 1:
         confidence -= 5  # Small amounts are less certain
     
-    confidence = max(0, min(100, confidence))
+    confidence = 0 if confidence < 0 else (100 if confidence > 100 else confidence)
     
     # Interpretation
-    if confidence >= 80:
-        interpretation = "Very high confidence in forecast"
-    elif confidence >= 60:
-        interpretation = "High confidence in forecast"
-    elif confidence >= 40:
-        interpretation = "Moderate confidence in forecast"
-    else:
-        interpretation = "Low confidence in forecast"
+    interpretation = _rain_interpretation(confidence)
     
     return {
         "confidence_score": confidence,
@@ -448,17 +505,9 @@ def calculate_rain_confidence(
 
 # ==================== COMFORT INDICES ====================
 
-def calculate_comfort_index(temp_c: float, humidity: float, wind_speed_kmh: float) -> Dict[str, any]:
-    """
-    Calculate overall comfort index combining multiple factors.
-    
-    Returns comfort score 0-100 where:
-    - 80-100: Very comfortable
-    - 60-79: Comfortable
-    - 40-59: Moderate
-    - 20-39: Uncomfortable
-    - 0-19: Very uncomfortable
-    """
+@njit(cache=True)
+def _comfort_points(temp_c: float, humidity: float, wind_speed_kmh: float) -> int:
+    """Unclamped comfort points (numeric kernel of calculate_comfort_index)."""
     score = 50  # Start at neutral
     
     # Temperature comfort (optimal: 18-24°C)
@@ -491,24 +540,24 @@ def calculate_comfort_index(temp_c: float, humidity: float, wind_speed_kmh: floa
     elif wind_speed_kmh > 30:
         score -= 10
     
-    score = max(0, min(100, score))
+    return score
+
+
+def calculate_comfort_index(temp_c: float, humidity: float, wind_speed_kmh: float) -> Dict[str, any]:
+    """
+    Calculate overall comfort index combining multiple factors.
+    
+    Returns comfort score 0-100 where:
+    - 80-100: Very comfortable
+    - 60-79: Comfortable
+    - 40-59: Moderate
+    - 20-39: Uncomfortable
+    - 0-19: Very uncomfortable
+    """
+    score = max(0, min(100, _comfort_points(temp_c, humidity, wind_speed_kmh)))
     
     # Category
-    if score >= 80:
-        category = "very_comfortable"
-        description = "Excellent conditions for outdoor activities"
-    elif score >= 60:
-        category = "comfortable"
-        description = "Pleasant conditions"
-    elif score >= 40:
-        category = "moderate"
-        description = "Tolerable conditions"
-    elif score >= 20:
-        category = "uncomfortable"
-        description = "Uncomfortable conditions, limit outdoor exposure"
-    else:
-        category = "very_uncomfortable"
-        description = "Very uncomfortable conditions, avoid prolonged outdoor exposure"
+    category, description = _comfort_category(score)
     
     return {
         "score": score,
@@ -531,18 +580,21 @@ def calculate_all_insights(weather_data: Dict) -> Dict:
     """
     insights = {}
     
-    temp = weather_data.get("temperature_2m")
-    humidity = weather_data.get("relative_humidity_2m")
-    wind_speed = weather_data.get("wind_speed_10m")
-    precipitation = weather_data.get("precipitation", 0)
-    pressure = weather_data.get("pressure_msl", 1013.25)
-    cloud_cover = weather_data.get("cloud_cover", 0)
-    uv_index = weather_data.get("uv_index", 0)
-    visibility = weather_data.get("visibility", 10000)
-    weather_code = weather_data.get("weather_code", 0)
-    precip_prob = weather_data.get("precipitation_probability", 0)
-    
-    if temp is not None and humidity is not None:
+    get = weather_data.get
+    temp = get("temperature_2m")
+    humidity = get("relative_humidity_2m")
+    wind_speed = get("wind_speed_10m")
+    precipitation = get("precipitation", 0)
+    pressure = get("pressure_msl", 1013.25)
+    cloud_cover = get("cloud_cover", 0)
+    uv_index = get("uv_index", 0)
+    visibility = get("visibility", 10000)
+    weather_code = get("weather_code", 0)
+    precip_prob = get("precipitation_probability", 0)
+    
+    has_temp_humidity = temp is not None and humidity is not None
+    
+    if has_temp_humidity:
         # Temperature feels-like
         if temp > 27:
             insights["heat_index"] = calculate_heat_index(temp, humidity)
@@ -556,7 +608,7 @@ def calculate_all_insights(weather_data: Dict) -> Dict:
             insights["comfort"] = calculate_comfort_index(temp, humidity, wind_speed)
     
     # Fire risk
-    if all(v is not None for v in [temp, humidity, wind_speed]):
+    if has_temp_humidity and wind_speed is not None:
         insights["fire_risk"] = calculate_fire_risk_score(temp, humidity, wind_speed, precipitation)
     
     # UV exposure
@@ -564,15 +616,257 @@ def calculate_all_insights(weather_data: Dict) -> Dict:
         insights["uv_exposure"] = calculate_uv_exposure_score(uv_index, cloud_cover)
     
     # Travel disruption
-    if all(v is not None for v in [precipitation, wind_speed, visibility, temp, weather_code]):
+    if (precipitation is not None and wind_speed is not None and visibility is not None and
+            temp is not None and weather_code is not None):
         insights["travel_disruption"] = calculate_travel_disruption_risk(
             precipitation, wind_speed, visibility, temp, weather_code
         )
     
     # Rain confidence
-    if all(v is not None for v in [precip_prob, precipitation, cloud_cover, humidity]):
+    if (precip_prob is not None and precipitation is not None and
+            cloud_cover is not None and humidity is not None):
         insights["rain_confidence"] = calculate_rain_confidence(
             precip_prob, precipitation, cloud_cover, humidity
         )
     
     return insights
+
+
+
+# ==================== BATCH (VECTORIZED) INSIGHTS ====================
+#
+# Array versions of the calculations above for hourly/daily forecast
+# series. Each mirrors its scalar counterpart branch for branch, using
+# masks and np.select in place of the if/elif ladders.
+
+def calculate_heat_index_vec(temp_c: np.ndarray, humidity: np.ndarray) -> np.ndarray:
+    """Vectorized calculate_heat_index (Celsius in, Celsius out)."""
+    T = temp_c * 9/5 + 32
+    RH = humidity
+    
+    T_RH = T * RH
+    HI = (-42.379 + T * (2.04901523 - 0.00683783*T + 0.00122874*T_RH - 0.00000199*T_RH*RH) +
+          RH * (10.14333127 - 0.22475541*T - 0.05481717*RH + 0.00085282*T_RH))
+    
+    dry = (RH < 13) & (T >= 80) & (T <= 112)
+    humid = ~dry & (RH > 85) & (T >= 80) & (T <= 87)
+    dry_adjustment = ((13 - RH) / 4) * np.sqrt(np.maximum(0, (17 - np.abs(T - 95)) / 17))
+    humid_adjustment = ((RH - 85) / 10) * ((87 - T) / 5)
+    HI = HI - np.where(dry, dry_adjustment, 0) + np.where(humid, humid_adjustment, 0)
+    
+    return np.where(T < 80, temp_c, (HI - 32) * 5/9)
+
+
+def calculate_wind_chill_vec(temp_c: np.ndarray, wind_speed_kmh: np.ndarray) -> np.ndarray:
+    """Vectorized calculate_wind_chill (Celsius, km/h)."""
+    with np.errstate(invalid="ignore"):
+        wind_factor = np.power(wind_speed_kmh, 0.16)
+    WC = 13.12 + 0.6215*temp_c + (0.3965*temp_c - 11.37) * wind_factor
+    return np.where((temp_c > 10) | (wind_speed_kmh < 4.8), temp_c, WC)
+
+
+def calculate_wet_bulb_temperature_vec(temp_c: np.ndarray, humidity: np.ndarray) -> np.ndarray:
+    """Vectorized calculate_wet_bulb_temperature (Stull's formula)."""
+    T = temp_c
+    RH = humidity
+    return (T * np.arctan(0.151977 * np.sqrt(RH + 8.313659)) +
+            np.arctan(T + RH) - np.arctan(RH - 1.676331) +
+            0.00391838 * RH * np.sqrt(RH) * np.arctan(0.023101 * RH) - 4.686035)
+
+
+def calculate_fire_risk_score_vec(
+    temp_c: np.ndarray,
+    humidity: np.ndarray,
+    wind_speed_kmh: np.ndarray,
+    precipitation_mm: np.ndarray,
+    days_since_rain: np.ndarray
+) -> np.ndarray:
+    """Vectorized score of calculate_fire_risk_score (0-100)."""
+    score = (
+        np.select([temp_c > 35, temp_c > 30, temp_c > 25, temp_c > 20], [30, 25, 15, 5], 0) +
+        np.select([humidity < 20, humidity < 30, humidity < 40, humidity < 50], [30, 25, 15, 5], 0) +
+        np.select([wind_speed_kmh > 40, wind_speed_kmh > 30, wind_speed_kmh > 20, wind_speed_kmh > 10], [20, 15, 10, 5], 0)
+    )
+    dryness = np.select([days_since_rain > 14, days_since_rain > 7, days_since_rain > 3], [20, 15, 10], 0)
+    score = np.where(precipitation_mm == 0, score + dryness, np.maximum(0, score - 10))
+    return np.minimum(100, score)
+
+
+def calculate_comfort_score_vec(temp_c: np.ndarray, humidity: np.ndarray, wind_speed_kmh: np.ndarray) -> np.ndarray:
+    """Vectorized score of calculate_comfort_index (0-100)."""
+    temp_points = np.select(
+        [
+            (temp_c >= 18) & (temp_c <= 24),
+            ((temp_c >= 15) & (temp_c < 18)) | ((temp_c > 24) & (temp_c <= 28)),
+            ((temp_c >= 10) & (temp_c < 15)) | ((temp_c > 28) & (temp_c <= 32)),
+            (temp_c < 0) | (temp_c > 38),
+        ],
+        [25, 15, 5, -20],
+        -10
+    )
+    humidity_points = np.select(
+        [
+            (humidity >= 40) & (humidity <= 60),
+            ((humidity >= 30) & (humidity < 40)) | ((humidity > 60) & (humidity <= 70)),
+            (humidity < 20) | (humidity > 80),
+        ],
+        [15, 5, -15],
+        -5
+    )
+    wind_points = np.select(
+        [(wind_speed_kmh >= 5) & (wind_speed_kmh <= 15), wind_speed_kmh > 40, wind_speed_kmh > 30],
+        [10, -15, -10],
+        0
+    )
+    return np.clip(50 + temp_points + humidity_points + wind_points, 0, 100)
+
+
+def calculate_travel_disruption_score_vec(
+    precipitation_mm: np.ndarray,
+    wind_speed_kmh: np.ndarray,
+    visibility_m: np.ndarray,
+    temp_c: np.ndarray,
+    weather_code: np.ndarray
+) -> np.ndarray:
+    """Vectorized score of calculate_travel_disruption_risk (0-100)."""
+    score = (
+        np.select([precipitation_mm > 50, precipitation_mm > 20, precipitation_mm > 5], [40, 25, 10], 0) +
+        np.select([wind_speed_kmh > 75, wind_speed_kmh > 50, wind_speed_kmh > 30], [30, 20, 10], 0) +
+        np.select([visibility_m < 100, visibility_m < 500, visibility_m < 1000], [30, 20, 10], 0) +
+        np.select([temp_c < -10, temp_c < 0], [15, 10], 0) +
+        np.where(np.isin(weather_code, SEVERE_WEATHER_CODES), 20, 0)
+    )
+    return np.minimum(100, score)
+
+
+def calculate_rain_confidence_vec(
+    precipitation_probability: np.ndarray,
+    precipitation_mm: np.ndarray,
+    cloud_cover: np.ndarray,
+    humidity: np.ndarray
+) -> np.ndarray:
+    """Vectorized confidence score of calculate_rain_confidence (0-100)."""
+    confidence = (
+        np.select(
+            [precipitation_probability >= 80, precipitation_probability >= 60,
+             precipitation_probability >= 40, precipitation_probability >= 20],
+            [85, 70, 55, 40],
+            30
+        ) +
+        np.select(
+            [(cloud_cover > 80) & (humidity > 70), (cloud_cover > 60) & (humidity > 60),
+             (cloud_cover < 30) | (humidity < 40)],
+            [10, 5, -10],
+            0
+        ) +
+        np.select([precipitation_mm > 10, (precipitation_mm > 0) & (precipitation_mm < 1)], [5, -5], 0)
+    )
+    return np.clip(confidence, 0, 100)
+
+
+def _score_category(score: np.ndarray, thresholds: Sequence[int], labels: Sequence[str]) -> np.ndarray:
+    """Map scores to labels; labels has one more entry than thresholds (descending).
+    
+    NaN (missing) scores map to an empty string.
+    """
+    return np.select(
+        [np.isnan(score)] + [score >= t for t in thresholds],
+        ("",) + tuple(labels[:-1]),
+        labels[-1]
+    )
+
+
+def calculate_all_insights_batch(weather_data: Dict[str, Sequence[float]]) -> Dict[str, np.ndarray]:
+    """
+    Calculate insights for a whole series of weather samples at once.
+    
+    Batch counterpart of calculate_all_insights: takes one sequence per
+    parameter (e.g. an Open-Meteo hourly block) and returns one array per
+    insight (struct-of-arrays). Missing optional parameters use the same
+    defaults as the scalar version; missing values (None) become NaN.
+    Where the scalar version would omit an insight for a row (e.g. fire
+    risk without humidity or wind), its score is NaN and its category an
+    empty string.
+    
+    Args:
+        weather_data: Dict mapping parameter names to equal-length sequences
+    
+    Returns:
+        Dict of insight arrays
+    """
+    n = len(next((values for values in weather_data.values() if values is not None), ()))
+    
+    def column(key: str, default: float) -> np.ndarray:
+        values = weather_data.get(key)
+        if values is None:
+            return np.full(n, default, dtype=np.float64)
+        return np.asarray(values, dtype=np.float64)
+    
+    temp = column("temperature_2m", np.nan)
+    humidity = column("relative_humidity_2m", np.nan)
+    wind_speed = column("wind_speed_10m", np.nan)
+    precipitation = column("precipitation", 0)
+    cloud_cover = column("cloud_cover", 0)
+    uv_index = column("uv_index", 0)
+    visibility = column("visibility", 10000)
+    weather_code = column("weather_code", 0)
+    precip_prob = column("precipitation_probability", 0)
+    
+    # Rows with the inputs each insight needs (mirrors the scalar guards)
+    has_temp = ~np.isnan(temp)
+    has_humidity = ~np.isnan(humidity)
+    has_wind = ~np.isnan(wind_speed)
+    has_precipitation = ~np.isnan(precipitation)
+    has_temp_humidity = has_temp & has_humidity
+    fire_comfort_ok = has_temp_humidity & has_wind
+    travel_ok = has_temp & has_wind & has_precipitation & ~np.isnan(visibility) & ~np.isnan(weather_code)
+    rain_ok = has_humidity & has_precipitation & ~np.isnan(precip_prob) & ~np.isnan(cloud_cover)
+    
+    fire_score = np.where(
+        fire_comfort_ok,
+        calculate_fire_risk_score_vec(temp, humidity, wind_speed, precipitation, np.zeros(n)),
+        np.nan
+    )
+    comfort_score = np.where(fire_comfort_ok, calculate_comfort_score_vec(temp, humidity, wind_speed), np.nan)
+    travel_score = np.where(
+        travel_ok,
+        calculate_travel_disruption_score_vec(precipitation, wind_speed, visibility, temp, weather_code),
+        np.nan
+    )
+    rain_score = np.where(
+        rain_ok,
+        calculate_rain_confidence_vec(precip_prob, precipitation, cloud_cover, humidity),
+        np.nan
+    )
+    adjusted_uv = uv_index * (1 - (cloud_cover / 100) * 0.5)
+    
+    with np.errstate(invalid="ignore"):
+        wet_bulb = calculate_wet_bulb_temperature_vec(temp, humidity)
+    
+    return {
+        "heat_index": np.where(
+            has_temp_humidity & (temp > 27), calculate_heat_index_vec(temp, humidity), np.nan
+        ),
+        "wind_chill": np.where(
+            has_temp_humidity & (temp < 10) & (wind_speed > 0), calculate_wind_chill_vec(temp, wind_speed), np.nan
+        ),
+        "wet_bulb_temperature": wet_bulb,
+        "comfort_score": comfort_score,
+        "comfort_category": _score_category(
+            comfort_score, (80, 60, 40, 20),
+            ("very_comfortable", "comfortable", "moderate", "uncomfortable", "very_uncomfortable")
+        ),
+        "fire_risk_score": fire_score,
+        "fire_risk_category": _score_category(
+            fire_score, (81, 61, 41, 21), ("extreme", "very_high", "high", "moderate", "low")
+        ),
+        "uv_adjusted": adjusted_uv,
+        "uv_level": _score_category(
+            adjusted_uv, (11, 8, 6, 3), ("extreme", "very_high", "high", "moderate", "low")
+        ),
+        "travel_disruption_score": travel_score,
+        "travel_disruption_category": _score_category(
+            travel_score, (70, 50, 30, 10), ("severe", "major", "moderate", "minor", "minimal")
+        ),
+        "rain_confidence_score": rain_score
+    }
@@ -5,6 +5,7 @@ Endpoints:
 - GET /api/v3/marine/current - Current marine conditions
 - GET /api/v3/marine/forecast - Daily marine forecast
 - GET /api/v3/marine/tides - Tide predictions
+- GET /api/v3/marine/bundle - Current conditions + forecast in one call
 """
 
 from fastapi import APIRouter, HTTPException, Query
@@ -12,8 +13,10 @@ from typing import Optional
 from datetime import datetime, timedelta
 
 from modules.marine import (
+    MarineConditions,
     get_current_marine_conditions,
     get_marine_forecast,
+    get_marine_bundle,
     calculate_tide_approximation
 )
 from cache import get_cache
@@ -71,7 +74,7 @@ async def current_marine_conditions(
         result = await get_current_marine_conditions(latitude, longitude)
         
         # Cache for 30 minutes
-        if result.get("status") == "success":
+        if isinstance(result, MarineConditions):
             cache.set(cache_key, result, ttl=1800)
         
         return result
@@ -138,6 +141,43 @@ async def marine_forecast(
         )
 
 
+@router.get("/bundle")
+async def marine_bundle(
+    latitude: float = Query(..., ge=-90, le=90, description="Latitude coordinate"),
+    longitude: float = Query(..., ge=-180, le=180, description="Longitude coordinate"),
+    days: int = Query(7, ge=1, le=7, description="Number of forecast days"),
+):
+    """
+    Get current marine conditions and the daily forecast together.
+    
+    Both sections are built from a single upstream request, so clients
+    that need current + forecast pay one round-trip instead of two.
+    """
+    
+    try:
+        # Check cache
+        cache = get_cache()
+        cache_key = f"marine:bundle:{latitude:.4f}:{longitude:.4f}:{days}"
+        
+        cached = cache.get(cache_key)
+        if cached:
+            return cached
+        
+        result = await get_marine_bundle(latitude, longitude, days)
+        
+        # Cache for 30 minutes (bounded by the current-conditions section)
+        if isinstance(result["current"], MarineConditions):
+            cache.set(cache_key, result, ttl=1800)
+        
+        return result
+        
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"Failed to fetch marine bundle: {str(e)}"
+        )
+
+
 @router.get("/tides")
 async def tide_predictions(
     latitude: float = Query(..., ge=-90, le=90, description="Latitude coordinate"),
@@ -8,7 +8,7 @@ import pytest
 import time
 import threading
 from datetime import datetime, timezone
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import Mock, patch, MagicMock, AsyncMock
 
 
 # ==================== CACHE TESTS ====================
@@ -463,5 +463,369 @@ class TestConfig:
         assert "name" in locations[0]
 
 
+
+# ==================== POLLEN TESTS ====================
+
+class TestPollen:
+    """Tests for the pollen module."""
+    
+    def test_pollen_level_bands(self):
+        """Test EAN band boundaries for pollen levels."""
+        from modules.pollen import calculate_pollen_level, PollenLevel
+        
+        assert calculate_pollen_level(0, 0, 0, 0, 0, 0)["grass"]["level"] == PollenLevel.NONE
+        assert calculate_pollen_level(0, 0, 9.9, 0, 0, 0)["grass"]["level"] == PollenLevel.LOW
+        assert calculate_pollen_level(0, 0, 10, 0, 0, 0)["grass"]["level"] == PollenLevel.MODERATE
+        assert calculate_pollen_level(0, 0, 50, 0, 0, 0)["grass"]["level"] == PollenLevel.HIGH
+        assert calculate_pollen_level(0, 0, 200, 0, 0, 0)["grass"]["level"] == PollenLevel.VERY_HIGH
+        assert calculate_pollen_level(0, 0, 5000, 0, 0, 0)["grass"]["score"] == 100
+    
+    def test_fetch_pollen_forecast_cached(self):
+        """Test that repeated fetches for the same grid cell hit the cache."""
+        import asyncio
+        import httpx
+        from cache import Cache
+        from modules import pollen
+        
+        cache = Cache(default_ttl=60, max_size=100, cleanup_interval=300)
+        response = httpx.Response(
+            200,
+            json={"hourly": {"time": []}},
+            request=httpx.Request("GET", "https://air-quality-api.open-meteo.com/v1/air-quality")
+        )
+        client = Mock()
+        client.get = AsyncMock(return_value=response)
+        
+        try:
+            with patch.object(pollen, "get_cache", return_value=cache), \
+                 patch.object(pollen, "get_async_client", return_value=client):
+                asyncio.run(pollen.fetch_pollen_forecast(51.501, -0.12, 7))
+                asyncio.run(pollen.fetch_pollen_forecast(51.5, -0.12, 7))
+                
+                assert client.get.call_count == 1
+        finally:
+            cache.shutdown()
+    
+    def test_daily_forecast_keeps_integer_counts(self):
+        """Test that integer species counts are reported as ints, not floats."""
+        import asyncio
+        from cache import Cache
+        from modules import pollen
+        
+        cache = Cache(default_ttl=60, max_size=100, cleanup_interval=300)
+        data = {
+            "hourly": {
+                "time": ["2024-06-01T00:00", "2024-06-01T01:00"],
+                "grass_pollen": [0, 200],
+                "birch_pollen": [None, 12],
+                "alder_pollen": [1.5, 0.5]
+            }
+        }
+        
+        try:
+            with patch.object(pollen, "get_cache", return_value=cache), \
+                 patch.object(pollen, "fetch_pollen_forecast", AsyncMock(return_value=data)):
+                forecast = asyncio.run(pollen.get_daily_pollen_forecast(48.2, 16.4, 1))
+            
+            day = forecast["daily_forecast"][0]["pollen"]
+            assert day["grass"]["value"] == 200 and isinstance(day["grass"]["value"], int)
+            assert isinstance(day["tree"]["breakdown"]["birch"], int)
+            assert isinstance(day["weed"]["breakdown"]["ragweed"], int)
+            assert day["tree"]["breakdown"]["alder"] == 1.5
+        finally:
+            cache.shutdown()
+
+
+# ==================== MARINE TESTS ====================
+
+class TestMarine:
+    """Tests for the marine routes."""
+    
+    PAYLOAD = {
+        "hourly": {
+            "time": ["2024-06-01T00:00", "2024-06-01T01:00"],
+            "wave_height": [1.2, 1.4],
+            "wave_direction": [180, 190],
+            "wave_period": [8, 9],
+            "wind_wave_height": [0.5, 0.6],
+            "swell_wave_height": [0.9, 1.0],
+            "swell_wave_direction": [200, 210],
+            "swell_wave_period": [10, 11],
+            "ocean_current_velocity": [0.3, 0.2],
+            "ocean_current_direction": [90, 95]
+        },
+        "daily": {
+            "time": ["2024-06-01"],
+            "wave_height_max": [1.5],
+            "wave_direction_dominant": [185],
+            "wave_period_max": [9.5]
+        }
+    }
+    
+    def _get_twice(self, path: str):
+        """Call a marine route twice (upstream, then cache) with a stubbed fetch."""
+        from fastapi import FastAPI
+        from fastapi.testclient import TestClient
+        from cache import Cache
+        from routes import marine as marine_routes
+        
+        app = FastAPI()
+        app.include_router(marine_routes.router)
+        client = TestClient(app)
+        cache = Cache(default_ttl=60, max_size=100, cleanup_interval=300)
+        
+        try:
+            with patch.object(marine_routes, "get_cache", return_value=cache), \
+                 patch("modules.marine.fetch_marine_weather", AsyncMock(return_value=self.PAYLOAD)):
+                params = {"latitude": 36.6, "longitude": -121.9}
+                return client.get(path, params=params), client.get(path, params=params)
+        finally:
+            cache.shutdown()
+    
+    def test_current_route_serializes(self):
+        """Test that a successful current-conditions response serializes, also from cache."""
+        for response in self._get_twice("/api/v3/marine/current"):
+            assert response.status_code == 200
+            body = response.json()
+            assert body["status"] == "success"
+            assert body["waves"]["significant_height_m"] == 1.4
+            assert body["metadata"]["source"] == "Open-Meteo Marine Weather API"
+    
+    def test_bundle_route_serializes(self):
+        """Test that a successful bundle response serializes, also from cache."""
+        for response in self._get_twice("/api/v3/marine/bundle"):
+            assert response.status_code == 200
+            body = response.json()
+            assert body["current"]["metadata"]["source"] == "Open-Meteo Marine Weather API"
+            assert len(body["forecast"]["daily_forecast"]) == 1
+
+
+
+
+# ==================== PREDICTION TESTS ====================
+
+class TestPrediction:
+    """Tests for the prediction module."""
+    
+    def test_train_and_predict_constant_series(self):
+        """Test that a model trained on a flat series predicts that value."""
+        from datetime import date, timedelta
+        from modules.prediction import SimplePredictionModel
+        
+        start = date(2024, 1, 1)
+        data = [
+            {
+                "date": (start + timedelta(days=i)).isoformat(),
+                "temperature_max": 20.0,
+                "temperature_min": 10.0
+            }
+            for i in range(60)
+        ]
+        
+        model = SimplePredictionModel()
+        assert model.train(data[:20]) is False
+        assert model.train(data) is True
+        
+        pred, low, high = model.predict(model._compute_features(data, len(data) - 1))
+        
+        assert pred == pytest.approx(15.0, abs=1e-6)
+        assert (low, high) == pytest.approx((pred - 3.0, pred + 3.0))
+
+    
+    def test_model_save_load_roundtrip(self, tmp_path):
+        """Test that a saved model loads back with identical parameters."""
+        from modules.prediction import SimplePredictionModel
+        
+        model = SimplePredictionModel()
+        model.weights = [0.5, -1.25, 0.75, 0.125]
+        model.bias = 1.5
+        model.trained_at = "2024-01-01T00:00:00+00:00"
+        
+        path = str(tmp_path / "model.npz")
+        model.save(path)
+        
+        loaded = SimplePredictionModel()
+        assert loaded.load(path) is True
+        assert loaded.weights == model.weights
+        assert loaded.bias == model.bias
+        assert loaded.trained_at == model.trained_at
+        assert loaded.feature_names == model.feature_names
+        assert loaded.predict([1.0, 1.0, 1.0, 1.0])[0] == pytest.approx(1.625)
+        
+        # Reassigned weights take effect on the next prediction
+        loaded.weights = [1.0, 1.0, 1.0, 1.0]
+        assert loaded.predict([1.0, 1.0, 1.0, 1.0])[0] == pytest.approx(5.5)
+
+
+# ==================== REPORT TESTS ====================
+
+class TestReports:
+    """Tests for the report generators."""
+    
+    def test_pdf_xref_offsets(self):
+        """Test that the PDF cross-reference table points at each object."""
+        import re
+        from modules.reports.pdf_report import PDFReportGenerator
+        
+        weather_data = {
+            "daily": [
+                {"date": f"2024-01-0{d + 1}", "temperature_max": 10 + d,
+                 "temperature_min": 2 + d, "precipitation_sum": 1.5, "weather_code": 3}
+                for d in range(7)
+            ]
+        }
+        
+        pdf = PDFReportGenerator().generate("Paris (FR)", weather_data, "daily")
+        
+        assert pdf.startswith(b"%PDF-1.4")
+        assert pdf.endswith(b"%%EOF")
+        
+        xref_pos = int(re.search(rb"startxref\n(\d+)", pdf).group(1))
+        assert pdf[xref_pos:].startswith(b"xref")
+        
+        offsets = re.findall(rb"(\d{10}) 00000 n ", pdf)
+        assert len(offsets) == 6
+        for number, offset in enumerate(offsets, start=1):
+            assert pdf[int(offset):].startswith(b"%d 0 obj" % number)
+
+
+# ==================== WEATHER INSIGHTS TESTS ====================
+
+class TestWeatherInsights:
+    """Tests for the weather insights module."""
+    
+    def test_batch_matches_scalar_insights(self):
+        """Test that batch insights agree with calculate_all_insights per sample."""
+        import math
+        from modules.weather_insights import calculate_all_insights, calculate_all_insights_batch
+        
+        samples = [
+            {"temperature_2m": t, "relative_humidity_2m": h, "wind_speed_10m": w,
+             "precipitation": p, "cloud_cover": 50, "uv_index": 7, "visibility": 400,
+             "weather_code": code, "precipitation_probability": 60}
+            for t in (-15, 0, 9, 18, 27.5, 31, 36)
+            for h in (10, 45, 90)
+            for w in (0, 12, 45)
+            for p, code in ((0, 0), (0.5, 95), (25, 71))
+        ]
+        columns = {key: [sample[key] for sample in samples] for key in samples[0]}
+        
+        batch = calculate_all_insights_batch(columns)
+        
+        for i, sample in enumerate(samples):
+            insights = calculate_all_insights(sample)
+            for key in ("heat_index", "wind_chill"):
+                if key in insights:
+                    assert math.isclose(batch[key][i], insights[key], abs_tol=1e-9)
+                else:
+                    assert math.isnan(batch[key][i])
+            assert math.isclose(batch["wet_bulb_temperature"][i], insights["wet_bulb_temperature"], abs_tol=1e-9)
+            assert batch["comfort_score"][i] == insights["comfort"]["score"]
+            assert batch["comfort_category"][i] == insights["comfort"]["category"]
+            assert batch["fire_risk_score"][i] == insights["fire_risk"]["score"]
+            assert batch["fire_risk_category"][i] == insights["fire_risk"]["category"]
+            assert batch["uv_level"][i] == insights["uv_exposure"]["level"]
+            assert batch["travel_disruption_score"][i] == insights["travel_disruption"]["score"]
+            assert batch["travel_disruption_category"][i] == insights["travel_disruption"]["category"]
+            assert batch["rain_confidence_score"][i] == insights["rain_confidence"]["confidence_score"]
+    
+    def test_batch_masks_missing_inputs(self):
+        """Test that batch rows with missing inputs omit the same insights as the scalar version."""
+        import math
+        from modules.weather_insights import calculate_all_insights, calculate_all_insights_batch
+        
+        samples = [
+            {"temperature_2m": 30, "relative_humidity_2m": 40, "wind_speed_10m": 20},
+            {"temperature_2m": 30, "relative_humidity_2m": None, "wind_speed_10m": 20},
+            {"temperature_2m": 30, "relative_humidity_2m": 40, "wind_speed_10m": None},
+            {"temperature_2m": 5, "relative_humidity_2m": None, "wind_speed_10m": 20}
+        ]
+        columns = {key: [sample[key] for sample in samples] for key in samples[0]}
+        
+        batch = calculate_all_insights_batch(columns)
+        
+        for i, sample in enumerate(samples):
+            insights = calculate_all_insights(sample)
+            for name, score_key, category_key in (
+                ("comfort", "comfort_score", "comfort_category"),
+                ("fire_risk", "fire_risk_score", "fire_risk_category"),
+                ("travel_disruption", "travel_disruption_score", "travel_disruption_category")
+            ):
+                if name in insights:
+                    assert batch[score_key][i] == insights[name]["score"]
+                    assert batch[category_key][i] == insights[name]["category"]
+                else:
+                    assert math.isnan(batch[score_key][i])
+                    assert batch[category_key][i] == ""
+            
+            if "rain_confidence" in insights:
+                assert batch["rain_confidence_score"][i] == insights["rain_confidence"]["confidence_score"]
+            else:
+                assert math.isnan(batch["rain_confidence_score"][i])
+            
+            for key in ("heat_index", "wind_chill"):
+                assert (key in insights) == (not math.isnan(batch[key][i]))
+        
+        # Complete row is scored, rows missing humidity or wind are masked
+        assert not math.isnan(batch["fire_risk_score"][0])
+        assert math.isnan(batch["fire_risk_score"][1])
+        assert math.isnan(batch["comfort_score"][2])
+        assert math.isnan(batch["travel_disruption_score"][2])
+        assert math.isnan(batch["wind_chill"][3])
+        
+        # Without a temperature column nothing temperature-based is scored
+        batch = calculate_all_insights_batch({"relative_humidity_2m": [40], "wind_speed_10m": [20]})
+        assert math.isnan(batch["comfort_score"][0])
+        assert math.isnan(batch["heat_index"][0])
+        assert batch["fire_risk_category"][0] == ""
+
+
+# ==================== SUBSCRIPTION TIER TESTS ====================
+
+class TestSubscriptionTiers:
+    """Tests for subscription tier limits."""
+    
+    def test_rate_limiter_holds_limit_across_window_boundary(self):
+        """Test that a burst at the hour boundary never exceeds the limit in any rolling hour."""
+        from collections import deque
+        from middleware.api_key_auth import APIKeyRateLimiter
+        
+        limiter = APIKeyRateLimiter()
+        allowed_at = []
+        
+        # One request at the start, the rest of the quota just before the hour
+        # ends, then a burst right after it
+        schedule = [0.0] + [3599.0] * 59 + [3600.5] * 60 + [3601.0] * 60
+        for now in schedule:
+            with patch("middleware.api_key_auth.time.time", return_value=now):
+                if limiter.check_and_increment("key", "free")[0]:
+                    allowed_at.append(now)
+        
+        assert allowed_at.count(3600.5) == 1
+        assert allowed_at.count(3601.0) == 0
+        
+        recent = deque()
+        worst = 0
+        for now in allowed_at:
+            recent.append(now)
+            while recent[0] <= now - 3600:
+                recent.popleft()
+            worst = max(worst, len(recent))
+        assert worst == 60
+    
+    def test_rate_limiter_reports_hourly_limit(self):
+        """Test the API key limiter rejects requests over the hourly limit."""
+        from middleware.api_key_auth import APIKeyRateLimiter
+        
+        limiter = APIKeyRateLimiter()
+        for _ in range(60):
+            assert limiter.check_and_increment("key", "free")[0]
+        
+        allowed, limit_type, retry_after = limiter.check_and_increment("key", "free")
+        assert not allowed
+        assert limit_type == "hourly"
+        assert 0 < retry_after <= 3600
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])